@@ -8,7 +8,8 @@ from copy import deepcopy
 
 from config.config_models import (
     AppConfig, SiteConfig, ScrapingConfig, OutputConfig,
-    LLMConfig, EvaluationConfig, ChromeConfig, DeploymentConfig
+    LLMConfig, EvaluationConfig, ChromeConfig, DeploymentConfig,
+    DEFAULT_BLOCKED_URL_PATTERNS
 )
 
 
@@ -143,10 +144,10 @@ class ConfigLoader:
             ConfigurationError: If configuration cannot be loaded or parsed
         """
         config_path = config_path or cls.DEFAULT_CONFIG_PATH
-        print(f"Loading configuration for site '{site_name}' from {config_path}")
+        logger.debug("Loading configuration for site '%s' from %s", site_name, config_path)
         try:
             config_data = cls._load_json_config(config_path)
-            print(f"Configuration data loaded successfully for site '{site_name}'")
+            logger.debug("Configuration data loaded successfully for site '%s'", site_name)
             return cls._parse_config(config_data, site_name)
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration for site '{site_name}': {e}")
@@ -168,29 +169,29 @@ class ConfigLoader:
             try:
                 if key == "model":
                     modified_config.llm_config.default_model = value
-                    logger.info(f"Override: LLM model set to '{value}'")
+                    logger.info("Override: LLM model set to '%s'", value)
                 
                 elif key == "max_results":
                     modified_config.site_config.scraping_config.max_results_per_query = value
-                    logger.info(f"Override: Max results per query set to {value}")
+                    logger.info("Override: Max results per query set to %s", value)
                 
                 elif key == "headless":
                     modified_config.chrome_config.headless = value
-                    logger.info(f"Override: Headless mode set to {value}")
+                    logger.info("Override: Headless mode set to %s", value)
                 
                 elif key == "output_file":
                     modified_config.site_config.output_config.output_file = value
-                    logger.info(f"Override: Output file set to '{value}'")
+                    logger.info("Override: Output file set to '%s'", value)
                 
                 elif key == "environment":
                     modified_config.deployment_config.environment = value
-                    logger.info(f"Override: Environment set to '{value}'")
+                    logger.info("Override: Environment set to '%s'", value)
                 
                 else:
-                    logger.warning(f"Unknown override key: {key}")
+                    logger.warning("Unknown override key: %s", key)
                     
             except Exception as e:
-                logger.error(f"Failed to apply override {key}={value}: {e}")
+                logger.error("Failed to apply override %s=%s: %s", key, value, e)
         
         return modified_config
     
@@ -302,7 +303,7 @@ class ConfigLoader:
             chrome_driver_path=None,
             headless=True,
             window_size={"width": 3840, "height": 2160},
-            implicit_wait=3,
+            implicit_wait=0,
             user_agent=(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -381,18 +382,18 @@ class ConfigLoader:
         config_file = Path(config_path)
         
         if not config_file.exists():
-            print(f"Configuration file not found: {config_path}")
+            logger.error("Configuration file not found: %s", config_path)
             raise ConfigurationError(f"Configuration file not found: {config_path}")
         
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                print(f"Loading configuration from {config_path}")
+                logger.debug("Loading configuration from %s", config_path)
                 return json.load(f)
         except json.JSONDecodeError as e:
-            print(f"Error decoding JSON from {config_path}: {e}")
+            logger.error("Error decoding JSON from %s: %s", config_path, e)
             raise ConfigurationError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
-            print(f"Error reading configuration file: {e}")
+            logger.error("Error reading configuration file: %s", e)
             raise ConfigurationError(f"Error reading configuration file: {e}")
     
     @classmethod
@@ -412,7 +413,7 @@ class ConfigLoader:
         try:
             # Find site-specific configuration
             sites_config = config_data.get("sites", {})
-            print(f"Available sites in configuration: {list(sites_config.keys())}")
+            logger.debug("Available sites in configuration: %s", list(sites_config))
             if site_name not in sites_config:
                 raise ConfigurationError(f"Site '{site_name}' not found in configuration")
             
@@ -420,16 +421,16 @@ class ConfigLoader:
             
             # Parse site configuration
             site_config = cls._parse_site_config(site_data)
-            print(f"Parsed configuration for site '{site_name}': {site_config}")
+            logger.debug("Parsed configuration for site '%s': %s", site_name, site_config)
             # Parse other configurations with defaults
             llm_config = cls._parse_llm_config(config_data.get("llm", {}))
-            print(f"Parsed LLM configuration: {llm_config}")
+            logger.debug("Parsed LLM configuration: %s", llm_config)
             evaluation_config = cls._parse_evaluation_config(config_data.get("evaluation", {}))
-            print(f"Parsed evaluation configuration: {evaluation_config}")
+            logger.debug("Parsed evaluation configuration: %s", evaluation_config)
             chrome_config = cls._parse_chrome_config(config_data.get("chrome", {}))
-            print(f"Parsed Chrome configuration: {chrome_config}")
+            logger.debug("Parsed Chrome configuration: %s", chrome_config)
             deployment_config = cls._parse_deployment_config(config_data.get("deployment", {}))
-            print(f"Parsed deployment configuration: {deployment_config}")
+            logger.debug("Parsed deployment configuration: %s", deployment_config)
             
             return AppConfig(
                 site_config=site_config,
@@ -464,7 +465,11 @@ class ConfigLoader:
             no_results_selectors=scraping_data.get("no_results_selectors", []),
             max_results_per_query=scraping_data.get("max_results_per_query", 10),
             wait_timeout=scraping_data.get("wait_timeout", 10),
-            page_load_timeout=scraping_data.get("page_load_timeout", 30)
+            page_load_timeout=scraping_data.get("page_load_timeout", 30),
+            search_api_url=scraping_data.get("search_api_url"),
+            search_api_results_path=scraping_data.get("search_api_results_path", ""),
+            search_api_field_map=scraping_data.get("search_api_field_map", {}),
+            search_page_url=scraping_data.get("search_page_url")
         )
         
         output_config = OutputConfig(
@@ -509,12 +514,20 @@ class ConfigLoader:
             chrome_driver_path=chrome_data.get("chrome_driver_path"),
             headless=chrome_data.get("headless", True),
             window_size=chrome_data.get("window_size", {"width": 1280, "height": 720}),
-            implicit_wait=chrome_data.get("implicit_wait", 3),
+            implicit_wait=chrome_data.get("implicit_wait", 0),
             user_agent=chrome_data.get(
                 "user_agent",
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
+            ),
+            page_load_strategy=chrome_data.get("page_load_strategy", "eager"),
+            no_sandbox=chrome_data.get("no_sandbox", True),
+            enable_bidi=chrome_data.get("enable_bidi", False),
+            blocked_url_patterns=chrome_data.get(
+                "blocked_url_patterns", list(DEFAULT_BLOCKED_URL_PATTERNS)
+            ),
+            pool_size=chrome_data.get("pool_size", 4),
+            max_uses_per_instance=chrome_data.get("max_uses_per_instance", 50)
         )
     
     @classmethod
@@ -525,7 +538,8 @@ class ConfigLoader:
             log_level=deploy_data.get("log_level", "INFO"),
             enable_screenshots=deploy_data.get("enable_screenshots", False),
             delay_between_searches=deploy_data.get("delay_between_searches", 2),
-            enable_metrics_collection=deploy_data.get("enable_metrics_collection", False)
+            enable_metrics_collection=deploy_data.get("enable_metrics_collection", False),
+            parallelism=deploy_data.get("parallelism", 1)
         )
 
 
@@ -1,9 +1,20 @@
 """Configuration data models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
+# Resources the scraper never needs; blocked at the network layer via CDP
+# Stylesheets are deliberately not blocked: visibility checks (offsetParent,
+# innerText, is_displayed) rely on CSS to hide d-none/template/sr-only content
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff*", "*.ttf", "*.otf", "*.eot", "*.mp4", "*.webm", "*.mp3",
+    "*/analytics*", "*/gtm*", "*googletagmanager*", "*google-analytics*",
+    "*doubleclick*", "*segment.io*", "*hotjar*", "*facebook.net*",
+]
+
+
 @dataclass
 class ScrapingConfig:
     """Configuration for web scraping parameters."""
@@ -21,6 +32,16 @@ class ScrapingConfig:
     max_results_per_query: int
     wait_timeout: int
     page_load_timeout: int
+    # Optional JSON search endpoint used instead of driving the browser.
+    # The URL may contain {query} and {limit}; field map values are dotted
+    # paths into each result item, keyed by ScrapingResult attribute name.
+    search_api_url: Optional[str] = None
+    search_api_results_path: str = ""
+    search_api_field_map: Dict[str, str] = field(default_factory=dict)
+    # Optional search results page URL (same {query}/{limit} placeholders).
+    # Fetched over HTTP and parsed with lxml when server-rendered; otherwise
+    # the browser navigates to it directly instead of using the search form
+    search_page_url: Optional[str] = None
 
 
 @dataclass
@@ -68,6 +89,12 @@ class ChromeConfig:
     window_size: Dict[str, int]
     implicit_wait: int
     user_agent: str
+    page_load_strategy: str = "eager"
+    no_sandbox: bool = True
+    enable_bidi: bool = False
+    blocked_url_patterns: List[str] = field(default_factory=lambda: list(DEFAULT_BLOCKED_URL_PATTERNS))
+    pool_size: int = 4
+    max_uses_per_instance: int = 50
 
 
 @dataclass
@@ -78,6 +105,7 @@ class DeploymentConfig:
     enable_screenshots: bool
     delay_between_searches: int
     enable_metrics_collection: bool
+    parallelism: int = 1
 
 
 @dataclass
@@ -305,7 +305,7 @@ class ConfigDefaults:
     CHROME_DEFAULTS = {
         "headless": True,
         "window_size": {"width": 3840, "height": 2160},
-        "implicit_wait": 3,
+        "implicit_wait": 0,
         "page_load_timeout": 30
     }
     
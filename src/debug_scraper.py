@@ -16,7 +16,11 @@ Usage:
 import os
 import sys
 import argparse
-import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from config_loader import load_config_for_site, get_available_sites
 from scraper import setup_driver_with_config, scrape_site_with_config
 
@@ -34,6 +38,16 @@ def take_screenshot(driver, filename: str, description: str = ""):
         print(f"Failed to take screenshot: {e}")
         return None
 
+def wait_for_any_selector(driver, selectors, timeout: int = 10) -> bool:
+    """Wait until any CSS selector matches; returns False on timeout"""
+    try:
+        WebDriverWait(driver, timeout).until(EC.any_of(
+            *[EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in selectors]
+        ))
+        return True
+    except TimeoutException:
+        return False
+
 def debug_page_elements(driver, description: str = ""):
     """Debug current page elements"""
     try:
@@ -123,7 +137,8 @@ def run_debug_scraping(site_key: str, query: str, take_screenshots: bool = False
             
             # Wait and handle modals
             print(f"\n📍 STEP 2: Handling modals and popups")
-            time.sleep(3)
+            if not wait_for_any_selector(driver, config.site_config.scraping_config.search_input_selectors):
+                print("⚠️ Search input did not appear within 10s")
             
             # Import the modal handler
             from scraper import handle_modal_popups
@@ -141,7 +156,6 @@ def run_debug_scraping(site_key: str, query: str, take_screenshots: bool = False
             
             search_input = None
             from scraper import find_element_with_multiple_selectors
-            from selenium.webdriver.common.by import By
             
             search_input = find_element_with_multiple_selectors(
                 driver, search_selectors, wait_for_interactable=True, timeout=10
@@ -184,12 +198,10 @@ def run_debug_scraping(site_key: str, query: str, take_screenshots: bool = False
                     except Exception as js_error:
                         print(f"⚠️ JavaScript click failed: {js_error}")
                         # Use Enter key
-                        from selenium.webdriver.common.keys import Keys
                         search_input.send_keys(Keys.RETURN)
                         print("✅ Used Enter key")
             else:
                 print("⚠️ Search button not found, using Enter key")
-                from selenium.webdriver.common.keys import Keys
                 search_input.send_keys(Keys.RETURN)
             
             if take_screenshots:
@@ -197,7 +209,12 @@ def run_debug_scraping(site_key: str, query: str, take_screenshots: bool = False
             
             # Wait for results
             print(f"\n📍 STEP 5: Waiting for search results")
-            time.sleep(5)  # Wait longer for debug
+            scraping_config = config.site_config.scraping_config
+            if not wait_for_any_selector(
+                driver, scraping_config.product_card_selectors + scraping_config.no_results_selectors,
+                timeout=scraping_config.wait_timeout
+            ):
+                print("⚠️ Neither product cards nor a no-results message appeared")
             
             debug_page_elements(driver, "After search submission")
             
@@ -271,7 +288,6 @@ def run_debug_scraping(site_key: str, query: str, take_screenshots: bool = False
             
             # Reset to initial page for clean test
             driver.get(config.site_config.target_url)
-            time.sleep(2)
             
             results = scrape_site_with_config(driver, query, config.site_config, debug_mode=True)
             
@@ -1,6 +1,7 @@
 """Main evaluation engine that orchestrates the LLM evaluation process."""
 
 import json
+import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
@@ -13,6 +14,9 @@ from .llm_client import LLMClient, LLMClientFactory, LLMRequest
 from .response_parser import ResponseParserFactory, ParsedEvaluation
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class EvaluationRequest:
     """Request for search result evaluation."""
@@ -72,8 +76,8 @@ class SearchEvaluationEngine:
             search_type = request.search_type or self.search_classifier.classify(request.query)
             model = request.model or self.config.default_model
             
-            print(f"Evaluating query: '{request.query}' (Type: {search_type.value})")
-            print(f"Results count: {len(request.results)}")
+            logger.info(f"Evaluating query: '{request.query}' (Type: {search_type.value})")
+            logger.info(f"Results count: {len(request.results)}")
             
             # Step 2: Analyze inventory
             inventory_data = self.inventory_analyzer.analyze_results(request.results)
@@ -132,7 +136,7 @@ class SearchEvaluationEngine:
             )
             
         except Exception as e:
-            print(f"Error in evaluation: {e}")
+            logger.error(f"Error in evaluation: {e}")
             return EvaluationResult(
                 query=request.query,
                 search_type=SearchType.ENGLISH_WORD,  # Default
@@ -147,7 +151,7 @@ class SearchEvaluationEngine:
     def _generate_executive_summary(self, query: str, evaluation: ParsedEvaluation, model: str) -> Optional[Dict[str, Any]]:
         """Generate executive summary for the evaluation."""
         try:
-            print("Generating executive summary...")
+            logger.info("Generating executive summary...")
             
             # Create summary prompt
             initial_analysis = json.dumps({
@@ -168,14 +172,14 @@ class SearchEvaluationEngine:
             summary = self.executive_summary_parser.parse(llm_response)
             
             if summary:
-                print("✅ Executive summary generated successfully")
+                logger.info("Executive summary generated successfully")
                 return summary
             else:
-                print("❌ Failed to parse executive summary")
+                logger.warning("Failed to parse executive summary")
                 return None
                 
         except Exception as e:
-            print(f"Error generating executive summary: {e}")
+            logger.error(f"Error generating executive summary: {e}")
             return None
     
     def is_service_available(self) -> bool:
@@ -231,7 +235,7 @@ def evaluate_search_results_with_inventory(
         try:
             search_type_enum = SearchType(search_type)
         except ValueError:
-            print(f"Unknown search type: {search_type}, will auto-detect")
+            logger.warning(f"Unknown search type: {search_type}, will auto-detect")
     
     # Create evaluation engine and request
     engine = SearchEvaluationEngine(config)
@@ -0,0 +1,62 @@
+"""JSON encode/decode helpers that prefer orjson when it is installed."""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document.
+    
+    Args:
+        data: JSON text as str or UTF-8 bytes
+        
+    Returns:
+        Decoded Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error type
+            subclasses it, so callers can catch the stdlib exception)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes.
+    
+    Args:
+        obj: JSON-serializable object
+        default: Called for objects JSON cannot encode natively (e.g. str)
+        
+    Returns:
+        Encoded JSON as bytes, ready to send as a request body
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=default
+    ).encode("utf-8")
+
+
+def dump_file(obj: Any, file_path: Union[str, Path]) -> None:
+    """Write an object as a 2-space indented UTF-8 JSON file.
+    
+    The layout is the same whether or not orjson is installed.
+    
+    Args:
+        obj: JSON-serializable object
+        file_path: Destination path (overwritten)
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(file_path, "wb") as f:
+        f.write(data)
@@ -1,6 +1,6 @@
 """LLM client interface and implementations."""
 
-from asyncio.log import logger
+import logging
 import requests
 import time
 from abc import ABC, abstractmethod
@@ -8,6 +8,10 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 from .config import LLMConfig
+from . import json_codec
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass 
@@ -77,18 +81,19 @@ class OllamaClient(LLMClient):
         for attempt in range(self.max_retries):
             try:
                 # Send POST request to Ollama API
-                print(f"Sending request to Ollama API: {self.api_endpoint}")
-                print(f"Request payload: {payload}")
-                print(f"Timeout: {self.timeout} seconds")
-                print(f"Attempt {attempt+1}/{self.max_retries}: Sending request to Ollama API")
+                logger.debug("Sending request to Ollama API: %s", self.api_endpoint)
+                logger.debug("Request payload: %s", payload)
+                logger.debug("Timeout: %s seconds", self.timeout)
+                logger.info("Attempt %s/%s: Sending request to Ollama API", attempt+1, self.max_retries)
                 response = requests.post(
                     self.api_endpoint,
-                    json=payload,
+                    data=json_codec.dumps(payload),
+                    headers={"Content-Type": "application/json"},
                     timeout=self.timeout
                 )
                 
                 if response.status_code == 200:
-                    response_data = response.json()
+                    response_data = json_codec.loads(response.content)
                     return LLMResponse(
                         content=response_data.get("response", ""),
                         model=request.model,
@@ -97,7 +102,7 @@ class OllamaClient(LLMClient):
                     )
                 else:
                     error_msg = f"API error: Status {response.status_code}, Response: {response.text}"
-                    print(f"Attempt {attempt+1}/{self.max_retries}: {error_msg}")
+                    logger.warning("Attempt %s/%s: %s", attempt+1, self.max_retries, error_msg)
                     
                     if attempt == self.max_retries - 1:  # Last attempt
                         return LLMResponse(
@@ -108,9 +113,11 @@ class OllamaClient(LLMClient):
                         )
                     time.sleep(1)
                     
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # ValueError covers a truncated/malformed body: json_codec raises
+                # json.JSONDecodeError (orjson's subclasses it), not a RequestException
                 error_msg = f"Request failed: {e}"
-                print(f"Attempt {attempt+1}/{self.max_retries}: {error_msg}")
+                logger.warning("Attempt %s/%s: %s", attempt+1, self.max_retries, error_msg)
                 
                 if attempt == self.max_retries - 1:  # Last attempt
                     return LLMResponse(
@@ -193,10 +200,10 @@ class OllamaClient(LLMClient):
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(prompt_data, f, indent=2, ensure_ascii=False)
             
-            print(f"[DEBUG] Prompt dumped to: {filepath}")
+            logger.debug("Prompt dumped to: %s", filepath)
             
         except Exception as e:
-            print(f"[WARNING] Failed to dump prompt to file: {e}")
+            logger.warning("Failed to dump prompt to file: %s", e)
 
 
 class MockLLMClient(LLMClient):
@@ -287,7 +294,7 @@ class RetryableLLMClient:
                 return response
             
             if attempt < self.max_retries - 1:
-                print(f"Retry attempt {attempt + 1} after {self.retry_delay}s delay")
+                logger.info("Retry attempt %s after %ss delay", attempt + 1, self.retry_delay)
                 time.sleep(self.retry_delay)
         
         return response  # Return last failed response
@@ -2,11 +2,16 @@
 
 import json
 import re
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 from .llm_client import LLMResponse
+from . import json_codec
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -46,39 +51,39 @@ class JSONResponseParser(ResponseParser):
             ParsedEvaluation or None if parsing failed
         """
         if not response.success:
-            print(f"Error in LLM response: {response.error_message}")
+            logger.error(f"Error in LLM response: {response.error_message}")
             return None
         
         try:
             content = response.content
-            print(f"📝 Raw LLM response length: {len(content)} characters")
+            logger.debug(f"Raw LLM response length: {len(content)} characters")
             
             # Step 1: Extract JSON from response
             json_str = self._extract_json_from_response(content)
             if not json_str:
-                print("❌ Could not extract JSON from response")
+                logger.warning("Could not extract JSON from response")
                 if self.strict:
                     return None
                 return self._fallback_manual_extraction(content)
             
-            print(f"✅ Extracted JSON ({len(json_str)} chars)")
+            logger.debug(f"Extracted JSON ({len(json_str)} chars)")
             
             # Step 2: Try to parse JSON
             try:
-                parsed_data = json.loads(json_str)
+                parsed_data = json_codec.loads(json_str)
                 
                 # Step 3: Validate structure
                 if self._validate_evaluation_structure(parsed_data):
-                    print(f"✅ Successfully parsed evaluation with {len(parsed_data.get('evaluations', []))} evaluations")
+                    logger.info(f"Successfully parsed evaluation with {len(parsed_data.get('evaluations', []))} evaluations")
                     return self._create_parsed_evaluation(parsed_data, content)
                 else:
-                    print("⚠️ Parsed JSON but structure validation failed")
+                    logger.warning("Parsed JSON but structure validation failed")
                     if self.strict:
                         return None
                     return self._fallback_manual_extraction(content)
                     
             except json.JSONDecodeError as e:
-                print(f"❌ Initial JSON parsing failed: {e}")
+                logger.warning(f"Initial JSON parsing failed: {e}")
                 
                 if self.strict:
                     return None
@@ -86,9 +91,9 @@ class JSONResponseParser(ResponseParser):
                 # Step 4: Try to fix common JSON issues
                 fixed_json = self._fix_common_json_issues(json_str)
                 try:
-                    parsed_data = json.loads(fixed_json)
+                    parsed_data = json_codec.loads(fixed_json)
                     if self._validate_evaluation_structure(parsed_data):
-                        print(f"✅ Successfully parsed after fixes")
+                        logger.info("Successfully parsed after fixes")
                         return self._create_parsed_evaluation(parsed_data, content)
                 except json.JSONDecodeError:
                     pass
@@ -97,7 +102,7 @@ class JSONResponseParser(ResponseParser):
                 return self._fallback_manual_extraction(content)
         
         except Exception as e:
-            print(f"Unexpected error in parsing: {e}")
+            logger.error(f"Unexpected error in parsing: {e}")
             if self.strict:
                 return None
             return self._fallback_manual_extraction(response.content)
@@ -171,36 +176,36 @@ class JSONResponseParser(ResponseParser):
             required_keys = ["evaluations"]
             for key in required_keys:
                 if key not in data:
-                    print(f"Missing required key: {key}")
+                    logger.warning(f"Missing required key: {key}")
                     return False
             
             # Check evaluations array
             evaluations = data.get("evaluations", [])
             if not isinstance(evaluations, list):
-                print("evaluations is not a list")
+                logger.warning("evaluations is not a list")
                 return False
             
             if len(evaluations) == 0:
-                print("evaluations array is empty")
+                logger.warning("evaluations array is empty")
                 return False
             
             # Check each evaluation entry
             required_eval_keys = ["result_index", "relevance_tier", "justification"]
             for i, evaluation in enumerate(evaluations):
                 if not isinstance(evaluation, dict):
-                    print(f"Evaluation {i} is not a dictionary")
+                    logger.warning(f"Evaluation {i} is not a dictionary")
                     return False
                 
                 for key in required_eval_keys:
                     if key not in evaluation:
-                        print(f"Evaluation {i} missing required key: {key}")
+                        logger.warning(f"Evaluation {i} missing required key: {key}")
                         return False
             
-            print(f"✅ Structure validation passed for {len(evaluations)} evaluations")
+            logger.debug(f"Structure validation passed for {len(evaluations)} evaluations")
             return True
             
         except Exception as e:
-            print(f"Error in structure validation: {e}")
+            logger.error(f"Error in structure validation: {e}")
             return False
     
     def _create_parsed_evaluation(self, data: Dict[str, Any], raw_response: str) -> ParsedEvaluation:
@@ -216,7 +221,7 @@ class JSONResponseParser(ResponseParser):
     
     def _fallback_manual_extraction(self, text: str) -> Optional[ParsedEvaluation]:
         """Fallback manual extraction when JSON parsing fails."""
-        print("🔧 Attempting fallback manual extraction...")
+        logger.info("Attempting fallback manual extraction...")
         
         try:
             evaluations = []
@@ -253,7 +258,7 @@ class JSONResponseParser(ResponseParser):
                 evaluations.append(evaluation)
             
             if evaluations:
-                print(f"✅ Manual extraction successful: {len(evaluations)} evaluations")
+                logger.info(f"Manual extraction successful: {len(evaluations)} evaluations")
                 return ParsedEvaluation(
                     search_analysis={"total_results": len(evaluations)},
                     evaluations=evaluations,
@@ -263,11 +268,11 @@ class JSONResponseParser(ResponseParser):
                     raw_response=text
                 )
             
-            print("❌ Manual extraction also failed")
+            logger.error("Manual extraction also failed")
             return None
             
         except Exception as e:
-            print(f"Manual extraction error: {e}")
+            logger.error(f"Manual extraction error: {e}")
             return None
     
     def _extract_values(self, text: str, patterns: List[str]) -> List[str]:
@@ -294,7 +299,7 @@ class ExecutiveSummaryParser(ResponseParser):
     def parse(self, response: LLMResponse) -> Optional[Dict[str, Any]]:
         """Parse executive summary response."""
         if not response.success:
-            print(f"Error in executive summary response: {response.error_message}")
+            logger.error(f"Error in executive summary response: {response.error_message}")
             return None
         
         try:
@@ -303,25 +308,25 @@ class ExecutiveSummaryParser(ResponseParser):
             # Extract JSON
             json_str = self._extract_json_from_response(content)
             if not json_str:
-                print("❌ Could not extract JSON from executive summary response")
+                logger.warning("Could not extract JSON from executive summary response")
                 return None
             
             # Parse JSON
-            parsed_data = json.loads(json_str)
+            parsed_data = json_codec.loads(json_str)
             
             # Validate executive summary structure
             if self._validate_executive_summary_structure(parsed_data):
-                print("✅ Successfully parsed executive summary")
+                logger.info("Successfully parsed executive summary")
                 return parsed_data
             else:
-                print("⚠️ Executive summary structure validation failed")
+                logger.warning("Executive summary structure validation failed")
                 return None
                 
         except json.JSONDecodeError as e:
-            print(f"❌ Executive summary JSON parsing failed: {e}")
+            logger.warning(f"Executive summary JSON parsing failed: {e}")
             return None
         except Exception as e:
-            print(f"Unexpected error in executive summary parsing: {e}")
+            logger.error(f"Unexpected error in executive summary parsing: {e}")
             return None
     
     def _extract_json_from_response(self, response_text: str) -> Optional[str]:
@@ -334,7 +339,7 @@ class ExecutiveSummaryParser(ResponseParser):
         required_keys = ["business_recommendations", "quality_score", "conversion_likelihood"]
         for key in required_keys:
             if key not in data:
-                print(f"Missing required key in executive summary: {key}")
+                logger.warning(f"Missing required key in executive summary: {key}")
                 return False
         
         # Check business_recommendations structure
@@ -342,7 +347,7 @@ class ExecutiveSummaryParser(ResponseParser):
         br_required = ["relevancy_assessment", "inventory_impact", "recommended_actions"]
         for key in br_required:
             if key not in br:
-                print(f"Missing key in business_recommendations: {key}")
+                logger.warning(f"Missing key in business_recommendations: {key}")
                 return False
         
         return True
@@ -3,6 +3,7 @@
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import Protocol
 
 
@@ -21,13 +22,38 @@ class SearchClassifier(Protocol):
         ...
 
 
+_PART_NUMBER_PATTERN = re.compile(r'[0-9\-/]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def _classify_query(query: str) -> SearchType:
+    """Regex classification shared by all classifier instances.
+    
+    Must stay pure (no I/O, no logging): results are memoized per query string.
+    """
+    if not query or not query.strip():
+        return SearchType.ENGLISH_WORD
+    
+    # Normalize whitespace
+    normalized_query = _WHITESPACE_PATTERN.sub(' ', query).strip()
+    words = normalized_query.split()
+    
+    # Multiple words/terms
+    if len(words) > 1:
+        return SearchType.MULTIPLE_TERMS
+    
+    # Check if it's likely a part number (contains digits or special characters)
+    if _PART_NUMBER_PATTERN.search(query):
+        return SearchType.PART_NUMBER
+    
+    # Default to english word for single-word text queries
+    return SearchType.ENGLISH_WORD
+
+
 class RegexSearchClassifier:
     """Regular expression based search type classifier."""
     
-    def __init__(self):
-        self._part_number_pattern = re.compile(r'[0-9\-/]')
-        self._whitespace_pattern = re.compile(r'\s+')
-    
     def classify(self, query: str) -> SearchType:
         """
         Determines the type of search query.
@@ -38,23 +64,7 @@ class RegexSearchClassifier:
         Returns:
             SearchType indicating the query type
         """
-        if not query or not query.strip():
-            return SearchType.ENGLISH_WORD
-        
-        # Normalize whitespace
-        normalized_query = self._whitespace_pattern.sub(' ', query).strip()
-        words = normalized_query.split()
-        
-        # Multiple words/terms
-        if len(words) > 1:
-            return SearchType.MULTIPLE_TERMS
-        
-        # Check if it's likely a part number (contains digits or special characters)
-        if self._part_number_pattern.search(query):
-            return SearchType.PART_NUMBER
-        
-        # Default to english word for single-word text queries
-        return SearchType.ENGLISH_WORD
+        return _classify_query(query)
 
 
 class MLSearchClassifier:
@@ -67,7 +77,7 @@ class MLSearchClassifier:
     def classify(self, query: str) -> SearchType:
         """ML-based classification (not implemented yet)."""
         # Fallback to regex classifier for now
-        return RegexSearchClassifier().classify(query)
+        return _classify_query(query)
 
 
 class SearchClassifierFactory:
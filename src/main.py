@@ -1,7 +1,11 @@
 """Main orchestrator for the agentic search solution."""
 
+import os
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
 from datetime import datetime
 from typing import List, Dict, Any
 
@@ -15,6 +19,12 @@ from cli_handler import CLIHandler
 
 logger = logging.getLogger(__name__)
 
+# Ollama server-side concurrency knobs. These only take effect for an Ollama
+# server started from this process (or a child of it); an already-running
+# server keeps whatever values it was launched with.
+os.environ.setdefault("OLLAMA_NUM_PARALLEL", "4")
+os.environ.setdefault("OLLAMA_MAX_LOADED_MODELS", "1")
+
 
 class SearchOrchestrator:
     """Main orchestrator that coordinates the entire search and evaluation process."""
@@ -32,11 +42,24 @@ class SearchOrchestrator:
         self._setup_logging()
     
     def _setup_logging(self) -> None:
-        """Configure logging based on deployment settings."""
-        logging.basicConfig(
-            level=getattr(logging, self.config.deployment_config.log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        """Configure non-blocking logging based on deployment settings.
+        
+        Records are put on an in-memory queue and written out by a background
+        QueueListener, so console I/O never stalls the per-query loop.
+        """
+        log_queue = queue.Queue(-1)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         )
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        root_logger = logging.getLogger()
+        root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        root_logger.setLevel(getattr(logging, self.config.deployment_config.log_level))
     
     def run_search_campaign(self, scraped_results_file: str = None) -> None:
         """Run the complete search campaign for the configured site.
@@ -52,20 +75,35 @@ class SearchOrchestrator:
             
             search_tasks = self._get_all_search_tasks()
             search_session = SearchSession(self.config, scraped_results_file)
+            prefetched = search_session.prefetch_results(
+                [task["query"] for task in search_tasks if task.get("query")]
+            )
             
             for task_idx, task in enumerate(search_tasks):
+                task_started = time.monotonic()
                 try:
                     result = self._process_single_search(
                         task, task_idx, len(search_tasks), search_session
                     )
                     all_results.append(result)
+                    self.results_manager.append_progress(result)
                     
-                    if not scraped_results_file:  # Only delay for real scraping
-                        time.sleep(self.config.deployment_config.delay_between_searches)
+                    # Only delay for real, sequential scraping
+                    # The delay is a minimum interval between searches, so time
+                    # spent scraping and evaluating counts towards it
+                    if not scraped_results_file and not prefetched:
+                        remaining = (
+                            self.config.deployment_config.delay_between_searches
+                            - (time.monotonic() - task_started)
+                        )
+                        if remaining > 0:
+                            time.sleep(remaining)
                         
                 except Exception as e:
                     logger.error(f"Failed to process search task {task_idx + 1}: {e}")
-                    all_results.append(self._create_error_result(task, str(e)))
+                    error_result = self._create_error_result(task, str(e))
+                    all_results.append(error_result)
+                    self.results_manager.append_progress(error_result)
             
             # Generate final outputs
             self._finalize_campaign(all_results, time.time() - start_time)
@@ -74,6 +112,7 @@ class SearchOrchestrator:
             logger.error(f"Campaign failed: {e}")
             raise
         finally:
+            self.results_manager.close_progress()
             search_session.cleanup()
     
     def _log_campaign_start(self) -> None:
@@ -82,6 +121,10 @@ class SearchOrchestrator:
         logger.info(f"Target URL: {self.config.site_config.target_url}")
         logger.info(f"Model: {self.config.llm_config.default_model}")
         logger.info(f"Inventory ranking: {'Enabled' if self.config.evaluation_config.enable_inventory_ranking else 'Disabled'}")
+        logger.info(
+            f"Ollama parallelism: OLLAMA_NUM_PARALLEL={os.environ['OLLAMA_NUM_PARALLEL']}, "
+            f"OLLAMA_MAX_LOADED_MODELS={os.environ['OLLAMA_MAX_LOADED_MODELS']}"
+        )
     
     def _get_all_search_tasks(self) -> List[Dict[str, Any]]:
         """Get all search tasks including regular and inventory test cases."""
@@ -1,6 +1,5 @@
 """Results management and output generation module."""
 
-import json
 import os
 import logging
 from datetime import datetime
@@ -8,6 +7,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from config.config_models import AppConfig
+from llm import json_codec
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,38 @@ class ResultsManager:
         self.config = config
         self.output_dir = "analysis_result"
         self._ensure_output_directory()
+        self._progress_file = None
+        self.progress_file_path: Optional[str] = None
+    
+    def append_progress(self, result: Dict[str, Any]) -> None:
+        """Append one finished search result to the campaign's NDJSON log.
+        
+        The file is opened on first use and each line is flushed, so results
+        already processed survive a crash before save_campaign_results runs.
+        
+        Args:
+            result: Complete search result for a single task
+        """
+        try:
+            if self._progress_file is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                name_without_ext = self.config.site_config.output_config.output_file.replace('.json', '')
+                self.progress_file_path = os.path.join(
+                    self.output_dir, f"{name_without_ext}_{timestamp}.progress.ndjson"
+                )
+                self._progress_file = open(self.progress_file_path, 'ab')
+            
+            line = json_codec.dumps(result, default=str)
+            self._progress_file.write(line + b"\n")
+            self._progress_file.flush()
+        except Exception as e:
+            logger.warning("Could not append progress record: %s", e)
+    
+    def close_progress(self) -> None:
+        """Close the NDJSON progress log if one was opened."""
+        if self._progress_file is not None:
+            self._progress_file.close()
+            self._progress_file = None
     
     def save_campaign_results(
         self,
@@ -274,8 +306,7 @@ class ResultsManager:
             IOError: If file cannot be saved
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            json_codec.dump_file(data, file_path)
         except Exception as e:
             raise IOError(f"Failed to save file {file_path}: {e}")
 
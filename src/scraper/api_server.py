@@ -472,8 +472,8 @@ async def perform_scraping_task(task_id: str, request: ScrapingRequest):
         task_info["progress"] = 0.5
         task_info["message"] = f"Scraping {len(request.search_terms)} search terms"
         
-        # Perform scraping
-        results = scraper.scrape_with_config(
+        # Perform scraping off the event loop so other requests keep being served
+        results = await scraper.scrape_with_config_async(
             search_terms=request.search_terms,
             site_config=config.site_config,
             debug_mode=False
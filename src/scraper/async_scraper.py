@@ -0,0 +1,206 @@
+"""Concurrent scraping on Playwright's async API.
+
+Selenium's WebDriver protocol blocks on every command, so queries are scraped
+one after another. Here every search term gets its own BrowserContext on a
+single shared browser and the network/DOM waits of all queries overlap.
+"""
+
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+
+try:
+    from playwright.async_api import async_playwright, Browser, Page, Locator
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    async_playwright = None
+    Browser = Page = Locator = Any
+    PLAYWRIGHT_AVAILABLE = False
+
+from config.config_models import SiteConfig, ChromeConfig
+from .data_extractor import DataExtractor, BATCH_EXTRACT_JS
+
+
+logger = logging.getLogger(__name__)
+
+
+# BATCH_EXTRACT_JS is written for execute_script (reads `arguments`); wrap it
+# so page.evaluate can pass the same positional arguments.
+_EVALUATE_BATCH_JS = "(args) => (function () {%s}).apply(null, args)" % BATCH_EXTRACT_JS
+
+
+async def _first_visible_locator(page: Page, selectors: List[str], timeout_ms: int) -> Optional[Locator]:
+    """Return the highest-priority visible locator within one total timeout.
+
+    All selectors are polled together, like ElementFinder.find_element_with_selectors,
+    so a page without any of them costs timeout_ms rather than one timeout per selector.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_ms / 1000
+
+    while True:
+        for selector in selectors:
+            locator = page.locator(selector).first
+            try:
+                if await locator.is_visible():
+                    return locator
+            except Exception:
+                continue
+        if loop.time() >= deadline:
+            return None
+        await asyncio.sleep(0.1)
+
+
+async def _block_urls(context, page: Page, patterns: List[str]) -> None:
+    """Block URL patterns in the renderer, as WebDriverManager does for Selenium.
+
+    Network.setBlockedURLs drops requests inside Chromium; page.route() would
+    instead send every request through a Python handler.
+    """
+    try:
+        session = await context.new_cdp_session(page)
+        await session.send("Network.enable")
+        await session.send("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        logger.warning("Could not enable CDP request blocking: %s", e)
+
+
+async def scrape_site_async(
+    browser: Browser,
+    search_term: str,
+    site_config: SiteConfig,
+    user_agent: Optional[str] = None,
+    blocked_url_patterns: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Scrape one search term in an isolated browser context.
+
+    Args:
+        browser: Shared Playwright browser instance
+        search_term: Term to search for
+        site_config: Site configuration containing all scraping parameters
+        user_agent: Optional user agent for the context
+        blocked_url_patterns: URL wildcards dropped via CDP before fetching,
+            same format as ChromeConfig.blocked_url_patterns
+
+    Returns:
+        List of dictionaries containing scraped product data
+    """
+    scraping_config = site_config.scraping_config
+    wait_ms = scraping_config.wait_timeout * 1000
+    # Service worker fetches bypass the CDP block list (see WebDriverManager)
+    context = await browser.new_context(user_agent=user_agent, service_workers="block")
+
+    try:
+        page = await context.new_page()
+        page.set_default_timeout(wait_ms)
+        if blocked_url_patterns:
+            await _block_urls(context, page, blocked_url_patterns)
+
+        logger.info("Navigating to %s for '%s'", site_config.target_url, search_term)
+        await page.goto(
+            site_config.target_url,
+            wait_until="domcontentloaded",
+            timeout=scraping_config.page_load_timeout * 1000
+        )
+
+        search_input = await _first_visible_locator(page, scraping_config.search_input_selectors, wait_ms)
+        if search_input is None:
+            logger.error("Could not find search input for '%s'", search_term)
+            return []
+
+        await search_input.fill(search_term)
+
+        # Search button selectors are XPath expressions; fall back to Enter
+        search_button = await _first_visible_locator(
+            page, [f"xpath={selector}" for selector in scraping_config.search_button_selectors], 5000
+        )
+        if search_button is not None:
+            await search_button.click()
+        else:
+            await search_input.press("Enter")
+
+        # Wait for either product cards or a no-results message
+        try:
+            await page.wait_for_selector(
+                ", ".join(scraping_config.product_card_selectors + scraping_config.no_results_selectors),
+                state="attached"
+            )
+        except Exception:
+            logger.warning("Timed out waiting for search results for '%s'", search_term)
+
+        raw_products = await page.evaluate(_EVALUATE_BATCH_JS, [
+            scraping_config.product_card_selectors,
+            scraping_config.product_link_selector,
+            scraping_config.product_title_selectors,
+            scraping_config.product_sku_selectors,
+            scraping_config.product_price_selectors,
+            scraping_config.product_quantity_selectors,
+            scraping_config.badges_selectors,
+            scraping_config.exact_match_selectors,
+            scraping_config.max_results_per_query
+        ])
+
+        results = []
+        for raw in raw_products or []:
+            result = DataExtractor.result_from_batch(raw)
+            if result.is_valid():
+                results.append(result.to_dict())
+
+        logger.info("Successfully extracted %s products for '%s'", len(results), search_term)
+        return results
+
+    finally:
+        await context.close()
+
+
+async def scrape_many_async(
+    search_terms: List[str],
+    site_config: SiteConfig,
+    chrome_config: ChromeConfig,
+    concurrency: int = 4
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Scrape several search terms concurrently over one browser.
+
+    Args:
+        search_terms: List of search terms to scrape
+        site_config: Site configuration to use
+        chrome_config: Browser settings (headless mode, user agent)
+        concurrency: Maximum number of queries in flight at once
+
+    Returns:
+        Dictionary mapping search terms to their results
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        raise ImportError("playwright not installed. Install with: pip install playwright")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async with async_playwright() as playwright:
+        # Same renderer settings as the Selenium driver: no image decoding,
+        # no background throttling of contexts that are not in front
+        browser = await playwright.chromium.launch(
+            headless=chrome_config.headless,
+            args=[
+                "--blink-settings=imagesEnabled=false",
+                "--disable-background-timer-throttling",
+                "--disable-renderer-backgrounding",
+            ]
+        )
+
+        async def bounded_scrape(search_term: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await scrape_site_async(
+                        browser, search_term, site_config, chrome_config.user_agent,
+                        chrome_config.blocked_url_patterns
+                    )
+                except Exception as e:
+                    logger.error("Error scraping '%s': %s", search_term, e)
+                    return []
+
+        try:
+            results = await asyncio.gather(*(bounded_scrape(term) for term in search_terms))
+        finally:
+            await browser.close()
+
+    return dict(zip(search_terms, results))
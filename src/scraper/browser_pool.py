@@ -0,0 +1,206 @@
+"""Pool of pre-warmed WebDriver instances shared across scrape runs."""
+
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.config_models import ChromeConfig
+from .web_driver_manager import WebDriverManager
+from .exceptions import WebDriverError
+
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Hands out reusable Chrome drivers and recycles them after heavy use.
+
+    Starting Chrome costs several seconds and a handful of processes, so the
+    pool starts ``size`` drivers once and lends them out. A driver is quit and
+    replaced after ``max_uses`` leases or when it stops responding.
+
+    If a replacement cannot be started the pool shrinks; ``live`` reports the
+    current number of drivers, and acquire() fails instead of blocking once
+    the pool is closed or has no drivers left.
+    """
+
+    def __init__(
+        self,
+        chrome_config: ChromeConfig,
+        size: Optional[int] = None,
+        max_uses: Optional[int] = None
+    ):
+        """Initialize and pre-warm the pool.
+
+        Args:
+            chrome_config: Chrome configuration used for every driver
+            size: Number of drivers (defaults to chrome_config.pool_size)
+            max_uses: Leases before a driver is recycled (defaults to
+                chrome_config.max_uses_per_instance)
+        """
+        self.chrome_config = chrome_config
+        self.size = size or chrome_config.pool_size
+        self.max_uses = max_uses or chrome_config.max_uses_per_instance
+
+        self._available: Deque[WebDriver] = deque()
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._closed = False
+        self._replacing = 0
+
+        try:
+            for _ in range(self.size):
+                self._available.append(self._create_driver())
+        except Exception:
+            # Don't leak the Chrome processes already started
+            while self._available:
+                self._quit(self._available.popleft())
+            raise
+
+        logger.info("Browser pool ready with %s drivers (max %s uses each)", self.size, self.max_uses)
+
+    @property
+    def live(self) -> int:
+        """Number of drivers currently alive, idle or leased."""
+        with self._lock:
+            return len(self._uses) + self._replacing
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """Take a driver from the pool, blocking until one is free.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            WebDriver instance
+
+        Raises:
+            WebDriverError: If the pool is closed or empty, or no driver
+                became available within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._changed:
+            while not self._available:
+                if self._closed:
+                    raise WebDriverError("Browser pool is closed")
+                if not self._uses and not self._replacing:
+                    raise WebDriverError("Browser pool has no live drivers")
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise WebDriverError(f"No browser available within {timeout} seconds")
+                self._changed.wait(remaining)
+
+            if self._closed:
+                raise WebDriverError("Browser pool is closed")
+            return self._available.popleft()
+
+    def release(self, driver: WebDriver) -> None:
+        """Return a driver to the pool, recycling it if worn out or unhealthy.
+
+        Args:
+            driver: Driver previously obtained from acquire()
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if self._closed:
+            self._quit(driver)
+            return
+
+        if uses >= self.max_uses or not self._reset(driver):
+            logger.info("Recycling browser after %s uses", uses)
+            with self._lock:
+                # Counts as live while the replacement starts
+                self._replacing += 1
+            try:
+                self._quit(driver)
+                driver = self._create_driver()
+            except Exception as e:
+                logger.error("Could not replace recycled browser: %s", e)
+                driver = None
+            finally:
+                with self._changed:
+                    self._replacing -= 1
+                    # Wake waiters so they fail if this was the last driver
+                    self._changed.notify_all()
+            if driver is None:
+                return
+
+        with self._changed:
+            if not self._closed:
+                self._available.append(driver)
+                self._changed.notify()
+                return
+        self._quit(driver)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Context manager that acquires a driver and always releases it.
+
+        Args:
+            timeout: Maximum seconds to wait for a free driver
+
+        Yields:
+            WebDriver instance
+        """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit every idle driver; leased drivers are quit when released."""
+        with self._changed:
+            self._closed = True
+            idle = list(self._available)
+            self._available.clear()
+            self._changed.notify_all()
+
+        for driver in idle:
+            self._quit(driver)
+        logger.info("Browser pool closed")
+
+    def _create_driver(self) -> WebDriver:
+        """Start a new driver and register it for use counting."""
+        driver = WebDriverManager(self.chrome_config).create_driver()
+        if driver is None:
+            raise WebDriverError("Failed to create WebDriver for browser pool")
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _reset(self, driver: WebDriver) -> bool:
+        """Clear state between leases; returns False if the driver is unhealthy."""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning("Browser failed health check: %s", e)
+            return False
+
+    def _quit(self, driver: WebDriver) -> None:
+        """Quit a driver and forget its use count."""
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting pooled browser: %s", e)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -10,6 +10,7 @@ from datetime import datetime
 
 from scraper_factory import ScraperFactory, ScraperType
 from config.config_loader import ConfigLoader, ConfigurationError
+from llm import json_codec
 from result_processor import ResultProcessor, CommonFilters
 from utilities import LoggingUtils, FileUtils, ValidationUtils
 from exceptions import ScrapingError, ErrorHandler
@@ -627,8 +628,7 @@ Examples:
     def _save_results(self, results: Dict[str, List[Dict[str, Any]]], filepath: str, format_type: str) -> None:
         """Save results in specified format."""
         if format_type == 'json':
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(results, filepath)
         elif format_type == 'csv':
             self._save_as_csv(results, filepath)
         elif format_type == 'xlsx':
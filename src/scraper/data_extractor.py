@@ -1,11 +1,12 @@
 """Data extraction utilities for web scraping."""
 
 import re
+import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import WebDriverException
 
 from .element_finder import ElementFinder
 from config.config_models import ScrapingConfig
@@ -14,6 +15,137 @@ from config.config_models import ScrapingConfig
 logger = logging.getLogger(__name__)
 
 
+# Checkmark glyphs rendered inside SKU spans
+_CHECK_CHARS = '✓☑✔'
+_CHECK_TABLE = str.maketrans('', '', _CHECK_CHARS)
+_CHECK_RE = re.compile(f'[{_CHECK_CHARS}]')
+
+# Compiled once; tried in order when no SKU selector matched
+_SKU_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'SKU:?\s*([A-Za-z0-9\-]+)',
+        r'Part\s*#:?\s*([A-Za-z0-9\-]+)',
+        r'Item\s*#:?\s*([A-Za-z0-9\-]+)',
+        r'Model:?\s*([A-Za-z0-9\-]+)',
+    )
+]
+_SKU_PREFIXES = ("Vendor Part #:", "SKU:", "Part #:")
+_SKIPPED_LINK_PARTS = ('mailto:', 'tel:', 'javascript:', '#')
+_PRODUCT_LINK_PARTS = ('/product/', '/item/', '/p/', '/details/')
+
+def _text_content(element: WebElement) -> str:
+    """Return an element's whitespace-collapsed textContent.
+    
+    Unlike WebElement.text this is a plain DOM property read: no layout or
+    visibility computation in the browser.
+    """
+    return " ".join((element.get_property("textContent") or "").split())
+
+
+# className, rendered text and all visible nested span texts of an element in
+# one round trip; innerText matches WebElement.text (an unrendered element's
+# innerText falls back to textContent, hence the d-none filter)
+_PRICE_PARTS_JS = """
+const el = arguments[0];
+const rendered = (node) => (node.innerText || '').replace(/\\s+/g, ' ').trim();
+return [String(el.className || ''), rendered(el),
+        ...Array.from(el.querySelectorAll('span:not(.d-none)'), rendered)];
+"""
+
+# Hidden sku-id value (or null), visible vendor-value span texts (or null) and
+# the element's own text, in one round trip
+_SKU_PARTS_JS = """
+const el = arguments[0];
+const collapse = (node) => node.textContent.replace(/\\s+/g, ' ').trim();
+const hidden = el.querySelector("input[name='sku-id']");
+const vendor = el.querySelector('span.vendor-value');
+return [hidden ? hidden.value : null,
+        vendor ? Array.from(vendor.querySelectorAll('span:not(.d-none)'), collapse) : null,
+        collapse(el)];
+"""
+
+# (href, visible text) of every link in an element in one round trip
+_LINKS_JS = """
+return Array.from(arguments[0].querySelectorAll('a'), (a) => [a.href, (a.innerText || '').trim()]);
+"""
+
+
+# Extracts every product card on the results page inside the browser so the
+# whole page costs one WebDriver round trip instead of several per card.
+# Mirrors the per-element Selenium path in DataExtractor; Python-side cleanup
+# (SKU prefixes, quantity digits, fallbacks) is shared between both paths.
+BATCH_EXTRACT_JS = r"""
+const [cardSelectors, linkSelector, titleSelectors, skuSelectors, priceSelectors,
+       quantitySelectors, badgeSelectors, exactMatchSelectors, maxResults] = arguments;
+const CHECK_MARKS = /[\u2713\u2611\u2714]/g;
+const text = (el) => (el ? (el.innerText || '').trim() : '');
+const allMatches = (root, selectors) => {
+    for (const selector of selectors) {
+        const found = root.querySelectorAll(selector);
+        if (found.length) return Array.from(found);
+    }
+    return [];
+};
+const skuText = (el) => {
+    const hidden = el.querySelector("input[name='sku-id']");
+    if (hidden) return hidden.value || '';
+    const vendor = el.querySelector('span.vendor-value');
+    if (vendor) {
+        const parts = Array.from(vendor.querySelectorAll('span:not(.d-none)'))
+            .map(text)
+            .filter((t) => t && !t.match(CHECK_MARKS));
+        if (parts.length) return parts.join('');
+    }
+    return text(el).replace(CHECK_MARKS, '').trim();
+};
+// Same rules as _PRICE_PARTS_JS: collapsed rendered text, d-none spans skipped
+// (innerText of an unrendered element falls back to textContent)
+const collapsed = (el) => text(el).replace(/\s+/g, ' ');
+const priceText = (el) => {
+    if (String(el.className || '').includes('price-wrapper')) {
+        const parts = Array.from(el.querySelectorAll('span:not(.d-none)'))
+            .map(collapsed)
+            .filter((t) => t && !t.startsWith('(') && !t.endsWith(')'));
+        if (parts.length >= 2) return parts[0].replace(/\$/g, '') + '.' + parts[1];
+    }
+    return collapsed(el);
+};
+
+return allMatches(document, cardSelectors).slice(0, maxResults).map((card) => {
+    const product = {title: '', url: '', link_text: '', price: '', skus: [],
+                     quantities: [], badges: [], exact_badges: [], links: null, text: null};
+    for (const selector of titleSelectors) {
+        const t = text(card.querySelector(selector));
+        if (t) { product.title = t; break; }
+    }
+    const link = linkSelector ? card.querySelector(linkSelector) : null;
+    if (link) {
+        product.url = link.href || link.getAttribute('href') || '';
+        product.link_text = text(link);
+    }
+    product.skus = allMatches(card, skuSelectors).slice(0, 2).map(skuText);
+    for (const selector of priceSelectors) {
+        const el = card.querySelector(selector);
+        const price = el ? priceText(el) : '';
+        if (price) { product.price = price; break; }
+    }
+    product.quantities = allMatches(card, quantitySelectors).map(text);
+    product.badges = allMatches(card, badgeSelectors).map(text);
+    product.exact_badges = allMatches(card, exactMatchSelectors).map(text);
+    if (!(product.title || product.link_text) || !product.url) {
+        product.links = Array.from(card.querySelectorAll('a'))
+            .map((a) => ({href: a.href || '', text: text(a)}));
+    }
+    if (!product.skus.length || !product.skus[0]) product.text = card.innerText || '';
+    return product;
+});
+"""
+
+# Runtime.evaluate takes an expression, not a function body with `arguments`;
+# the arguments are appended as a JSON array followed by ")"
+_BATCH_EVALUATE_PREFIX = "(function () {" + BATCH_EXTRACT_JS + "}).apply(null, "
+
+
 class ScrapingResult:
     """Data class for scraping results."""
     
@@ -64,13 +196,15 @@ class ScrapingResult:
 class DataExtractor:
     """Handles extraction of product data from web elements."""
     
-    def __init__(self, element_finder: ElementFinder):
+    def __init__(self, element_finder: Optional[ElementFinder]):
         """Initialize data extractor.
         
         Args:
-            element_finder: ElementFinder instance for element location
+            element_finder: ElementFinder instance for element location (may be
+                None when only converting batch-extracted cards)
         """
         self.element_finder = element_finder
+        self._cdp_evaluate = True
     
     def extract_product_data(
         self,
@@ -103,7 +237,213 @@ class DataExtractor:
             self._extract_badges(card_element, scraping_config, result)
             
         except Exception as e:
-            logger.error(f"Error extracting data from product {card_index}: {e}")
+            logger.error("Error extracting data from product %s: %s", card_index, e)
+        
+        return result
+    
+    def compile_fast_extractor(
+        self,
+        scraping_config: ScrapingConfig
+    ) -> Optional[Callable[[WebElement], ScrapingResult]]:
+        """Build a per-card extractor specialized to single-selector configs.
+        
+        Once a site config has settled on one selector per field, the fallback
+        loops, selector-cache bookkeeping and missing-element handling
+        of extract_product_data are pure overhead. The returned function binds
+        the selectors up front and does one find_elements call per field.
+        
+        Args:
+            scraping_config: Configuration for scraping selectors
+            
+        Returns:
+            Function mapping a card element to a ScrapingResult, or None if any
+            per-card selector list has more than one entry
+        """
+        selector_lists = (
+            scraping_config.product_title_selectors,
+            scraping_config.product_sku_selectors,
+            scraping_config.product_price_selectors,
+            scraping_config.product_quantity_selectors,
+            scraping_config.badges_selectors,
+            scraping_config.exact_match_selectors,
+        )
+        if any(len(selectors) != 1 for selectors in selector_lists):
+            return None
+        
+        (title_selector,), (sku_selector,), (price_selector,), (quantity_selector,), \
+            (badge_selector,), (exact_match_selector,) = selector_lists
+        link_selector = scraping_config.product_link_selector
+        
+        def extract(card_element: WebElement) -> ScrapingResult:
+            result = ScrapingResult()
+            title_found = url_found = False
+            
+            for title_element in card_element.find_elements(By.CSS_SELECTOR, title_selector)[:1]:
+                title = _text_content(title_element)
+                if title:
+                    result.title = title
+                    title_found = True
+            
+            for link_element in card_element.find_elements(By.CSS_SELECTOR, link_selector)[:1]:
+                href = link_element.get_attribute("href")
+                if href:
+                    result.url = href
+                    url_found = True
+                    link_text = _text_content(link_element) if not title_found else ""
+                    if link_text:
+                        result.title = link_text
+                        title_found = True
+            
+            if not title_found or not url_found:
+                self._fallback_title_url_extraction(card_element, result, title_found, url_found)
+            
+            sku_elements = card_element.find_elements(By.CSS_SELECTOR, sku_selector)[:2]
+            for field_name, sku_element in zip(("part_number", "vendor_part_number"), sku_elements):
+                sku_text = self._extract_sku_from_html(sku_element)
+                if sku_text and sku_text.strip():
+                    setattr(result, field_name, self._clean_sku_text(sku_text))
+            if result.part_number == "N/A":
+                self._fallback_sku_extraction(card_element, result)
+            
+            for price_element in card_element.find_elements(By.CSS_SELECTOR, price_selector)[:1]:
+                price = self._extract_price_from_html(price_element)
+                if price and price.strip():
+                    result.price = price
+            
+            total_quantity = self._sum_quantities(
+                _text_content(element)
+                for element in card_element.find_elements(By.CSS_SELECTOR, quantity_selector)
+            )
+            if total_quantity > 0:
+                result.quantity = str(total_quantity)
+            
+            for badge in card_element.find_elements(By.CSS_SELECTOR, badge_selector):
+                text = _text_content(badge).lower()
+                if text == "partial match":
+                    result.partial_match = True
+                elif text == "cross ref match":
+                    result.cross_ref_match = True
+            result.exact_match = any(
+                _text_content(badge).lower() == "exact match"
+                for badge in card_element.find_elements(By.CSS_SELECTOR, exact_match_selector)
+            )
+            
+            return result
+        
+        return extract
+    
+    def extract_all_products(self, scraping_config: ScrapingConfig) -> Optional[List[ScrapingResult]]:
+        """Extract all product cards on the page with a single script execution.
+        
+        Args:
+            scraping_config: Configuration for scraping selectors
+            
+        Returns:
+            List of ScrapingResult objects (one per card, up to the configured
+            maximum), or None if the script could not be executed
+        """
+        script_args = [
+            scraping_config.product_card_selectors,
+            scraping_config.product_link_selector,
+            scraping_config.product_title_selectors,
+            scraping_config.product_sku_selectors,
+            scraping_config.product_price_selectors,
+            scraping_config.product_quantity_selectors,
+            scraping_config.badges_selectors,
+            scraping_config.exact_match_selectors,
+            scraping_config.max_results_per_query
+        ]
+        
+        try:
+            raw_products = self._evaluate_batch_script(script_args)
+        except WebDriverException as e:
+            logger.warning("Batch extraction script failed, falling back to per-element extraction: %s", e)
+            return None
+        
+        if raw_products is None:
+            return None
+        
+        return [self.result_from_batch(raw) for raw in raw_products]
+    
+    def _evaluate_batch_script(self, script_args: List[Any]) -> Optional[List[Dict[str, Any]]]:
+        """Run BATCH_EXTRACT_JS, preferring CDP Runtime.evaluate on Chromium.
+        
+        With returnByValue the renderer serializes the result to JSON once;
+        execute_script additionally has chromedriver walk the result looking
+        for element references. Falls back to execute_script for the rest of
+        the session if CDP is unavailable or the evaluation throws.
+        """
+        driver = self.element_finder.driver
+        
+        if self._cdp_evaluate and hasattr(driver, "execute_cdp_cmd"):
+            try:
+                response = driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": _BATCH_EVALUATE_PREFIX + json.dumps(script_args) + ")",
+                    "returnByValue": True
+                })
+                if "exceptionDetails" not in response:
+                    return response["result"].get("value")
+                logger.debug("Runtime.evaluate raised: %s", response["exceptionDetails"].get("text"))
+            except WebDriverException as e:
+                logger.debug("Runtime.evaluate unavailable: %s", e)
+            self._cdp_evaluate = False
+        
+        return driver.execute_script(BATCH_EXTRACT_JS, *script_args)
+    
+    @staticmethod
+    def result_from_batch(raw: Dict[str, Any]) -> ScrapingResult:
+        """Build a ScrapingResult from one card returned by BATCH_EXTRACT_JS.
+        
+        Shared by the Selenium batch path and the Playwright scraper, which
+        run the same script.
+        
+        Args:
+            raw: Card object produced by BATCH_EXTRACT_JS
+            
+        Returns:
+            ScrapingResult with cleaned fields
+        """
+        result = ScrapingResult()
+        title_found = url_found = False
+        
+        if raw.get("title"):
+            result.title = raw["title"]
+            title_found = True
+        if raw.get("url"):
+            result.url = raw["url"]
+            url_found = True
+            if not title_found and raw.get("link_text"):
+                result.title = raw["link_text"]
+                title_found = True
+        
+        if not title_found or not url_found:
+            links = [(link.get("href"), link.get("text", "")) for link in raw.get("links") or []]
+            DataExtractor._apply_fallback_links(links, result, title_found, url_found)
+        
+        skus = raw.get("skus") or []
+        if len(skus) > 0 and skus[0] and skus[0].strip():
+            result.part_number = DataExtractor._clean_sku_text(skus[0])
+        if len(skus) > 1 and skus[1] and skus[1].strip():
+            result.vendor_part_number = DataExtractor._clean_sku_text(skus[1])
+        if result.part_number == "N/A" and raw.get("text"):
+            DataExtractor._apply_sku_patterns(raw["text"], result)
+        
+        if raw.get("price"):
+            result.price = raw["price"]
+        
+        total_quantity = DataExtractor._sum_quantities(raw.get("quantities") or [])
+        if total_quantity > 0:
+            result.quantity = str(total_quantity)
+        
+        for text in raw.get("badges") or []:
+            text = text.strip().lower()
+            if text == "partial match":
+                result.partial_match = True
+            elif text == "cross ref match":
+                result.cross_ref_match = True
+        result.exact_match = any(
+            text.strip().lower() == "exact match" for text in raw.get("exact_badges") or []
+        )
         
         return result
     
@@ -117,15 +457,16 @@ class DataExtractor:
         title_found = False
         url_found = False
         
-        # Try configured title selectors
+        # Try configured title selectors in priority order
         for title_selector in scraping_config.product_title_selectors:
             title_element = self.element_finder.find_element_with_selectors(
                 title_selector, parent_element=card_element
             )
-            if title_element and title_element.text.strip():
-                result.title = title_element.text.strip()
+            title = _text_content(title_element) if title_element else ""
+            if title:
+                result.title = title
                 title_found = True
-                logger.debug(f"Found title with selector '{title_selector}': {result.title[:50]}...")
+                logger.debug("Found title with selector '%s': %s...", title_selector, result.title[:50])
                 break
         
         # Try to find URL using configured link selector
@@ -137,13 +478,14 @@ class DataExtractor:
             if href:
                 result.url = href
                 url_found = True
-                logger.debug(f"Found URL: {href}")
+                logger.debug("Found URL: %s", href)
                 
                 # If title not found yet, try to get it from the link
-                if not title_found and link_element.text.strip():
-                    result.title = link_element.text.strip()
+                link_text = _text_content(link_element) if not title_found else ""
+                if link_text:
+                    result.title = link_text
                     title_found = True
-                    logger.debug(f"Got title from link text: {result.title[:50]}...")
+                    logger.debug("Got title from link text: %s...", result.title[:50])
         
         # Fallback methods if configured selectors don't work
         if not title_found or not url_found:
@@ -162,28 +504,28 @@ class DataExtractor:
                 scraping_config.product_sku_selectors, parent_element=card_element
             )
             
-            logger.debug(f"Found {len(sku_elements)} SKU elements")
+            logger.debug("Found %s SKU elements", len(sku_elements))
             
             if len(sku_elements) > 0:
                 # Extract Part Number from the first element
                 part_number = self._extract_sku_from_html(sku_elements[0])
                 if part_number and part_number.strip():
                     result.part_number = self._clean_sku_text(part_number)
-                    logger.debug(f"Extracted part_number: {result.part_number}")
+                    logger.debug("Extracted part_number: %s", result.part_number)
             
             if len(sku_elements) > 1:
                 # Extract Vendor Part Number from the second element
                 vendor_part_number = self._extract_sku_from_html(sku_elements[1])
                 if vendor_part_number and vendor_part_number.strip():
                     result.vendor_part_number = self._clean_sku_text(vendor_part_number)
-                    logger.debug(f"Extracted vendor_part_number: {result.vendor_part_number}")
+                    logger.debug("Extracted vendor_part_number: %s", result.vendor_part_number)
             
             # Fallback: look for common SKU patterns in text
             if result.part_number == "N/A":
                 self._fallback_sku_extraction(card_element, result)
                 
         except Exception as e:
-            logger.error(f"Error extracting part numbers for product {card_index}: {e}")
+            logger.error("Error extracting part numbers for product %s: %s", card_index, e)
     
     def _extract_price(
         self,
@@ -200,7 +542,7 @@ class DataExtractor:
                 extracted_price = self._extract_price_from_html(price_element)
                 if extracted_price and extracted_price.strip():
                     result.price = extracted_price
-                    logger.debug(f"Found price: {extracted_price}")
+                    logger.debug("Found price: %s", extracted_price)
                     break
     
     def _extract_quantity(
@@ -211,23 +553,20 @@ class DataExtractor:
     ) -> None:
         """Extract quantity from product card."""
         try:
-            total_quantity = 0
             quantity_elements = self.element_finder.find_elements_with_selectors(
                 scraping_config.product_quantity_selectors, parent_element=card_element
             )
             
-            for idx, quantity_element in enumerate(quantity_elements):
-                extracted_quantity = self._extract_quantity_from_html(quantity_element)
-                if extracted_quantity is not None:
-                    total_quantity += extracted_quantity
-                    logger.debug(f"Added quantity from element {idx}: {extracted_quantity}")
+            total_quantity = self._sum_quantities(
+                _text_content(quantity_element) for quantity_element in quantity_elements
+            )
             
             if total_quantity > 0:
                 result.quantity = str(total_quantity)
-                logger.debug(f"Total quantity found: {total_quantity}")
+                logger.debug("Total quantity found: %s", total_quantity)
                 
         except Exception as e:
-            logger.error(f"Error extracting quantity: {e}")
+            logger.error("Error extracting quantity: %s", e)
     
     def _extract_badges(
         self,
@@ -242,8 +581,8 @@ class DataExtractor:
                 scraping_config.badges_selectors, parent_element=card_element
             )
             for badge in badge_elements:
-                text = badge.text.strip().lower()
-                logger.debug(f"Found badge text: '{text}'")
+                text = _text_content(badge).lower()
+                logger.debug("Found badge text: '%s'", text)
                 if text == "partial match":
                     result.partial_match = True
                 elif text == "cross ref match":
@@ -254,103 +593,96 @@ class DataExtractor:
                 scraping_config.exact_match_selectors, parent_element=card_element
             )
             for badge in exact_match_elements:
-                text = badge.text.strip().lower()
+                text = _text_content(badge).lower()
                 if text == "exact match":
                     result.exact_match = True
                     
         except Exception as e:
-            logger.error(f"Error extracting badges: {e}")
+            logger.error("Error extracting badges: %s", e)
     
     def _extract_sku_from_html(self, sku_element: WebElement) -> str:
         """Extract SKU from complex HTML structures with nested spans."""
         try:
+            hidden_value, vendor_span_texts, full_text = self.element_finder.driver.execute_script(
+                _SKU_PARTS_JS, sku_element
+            )
+            
             # Method 1: Check for hidden input with SKU value
-            try:
-                hidden_input = sku_element.find_element(By.CSS_SELECTOR, "input[name='sku-id']")
-                return hidden_input.get_attribute("value")
-            except NoSuchElementException:
-                pass
+            if hidden_value is not None:
+                return hidden_value
             
             # Method 2: Extract from vendor-value spans
-            try:
-                vendor_value = sku_element.find_element(By.CSS_SELECTOR, "span.vendor-value")
-                spans = vendor_value.find_elements(By.CSS_SELECTOR, "span:not(.d-none)")
-                sku_parts = []
-                
-                for span in spans:
-                    text = span.text.strip()
-                    if text and not any(char in text for char in ['✓', '☑', '✔']):
-                        sku_parts.append(text)
+            if vendor_span_texts:
+                sku_parts = [
+                    text for text in vendor_span_texts
+                    if text and not _CHECK_RE.search(text)
+                ]
                 
                 if sku_parts:
                     return ''.join(sku_parts)
-            except NoSuchElementException:
-                pass
             
             # Method 3: Fallback to getting all text and cleaning it
-            full_text = sku_element.text.strip()
-            full_text = full_text.replace('✓', '').replace('☑', '').replace('✔', '').strip()
-            return full_text
+            return full_text.translate(_CHECK_TABLE).strip()
             
         except Exception:
-            return sku_element.text.strip()
+            return _text_content(sku_element)
     
     def _extract_price_from_html(self, price_element: WebElement) -> str:
         """Extract price from complex HTML structures."""
         try:
+            class_name, full_text, *span_texts = self.element_finder.driver.execute_script(
+                _PRICE_PARTS_JS, price_element
+            )
+            
             # Method 1: Check if it's a price-wrapper with separate dollar and cents
-            if "price-wrapper" in price_element.get_attribute("class"):
-                spans = price_element.find_elements(By.TAG_NAME, "span")
-                price_parts = []
-                
-                for span in spans:
-                    text = span.text.strip()
-                    # Skip "(each)" and similar text
-                    if text and not text.startswith("(") and not text.endswith(")"):
-                        price_parts.append(text)
+            if "price-wrapper" in class_name:
+                # Skip "(each)" and similar text
+                price_parts = [
+                    text for text in span_texts
+                    if text and not text.startswith("(") and not text.endswith(")")
+                ]
                 
-                if price_parts:
+                if len(price_parts) >= 2:
                     dollars = price_parts[0].replace("$", "")
                     cents = price_parts[1]
                     return f"{dollars}.{cents}"
             
             # Method 2: Simple text extraction
-            return price_element.text.strip()
+            return full_text
             
         except Exception:
-            return price_element.text.strip()
+            return _text_content(price_element)
     
-    def _extract_quantity_from_html(self, quantity_element: WebElement) -> Optional[int]:
-        """Extract quantity from a Selenium WebElement."""
-        try:
-            logger.debug(f"Processing quantity element: {quantity_element}")
-            
-            if quantity_element:
-                quantity_text = quantity_element.text.strip()
-                logger.debug(f"Quantity text: '{quantity_text}'")
-                
-                digits = ''.join(filter(str.isdigit, quantity_text))
-                logger.debug(f"Extracted digits: '{digits}'")
-                
-                return int(digits) if digits else None
-            
-            return None
+    @staticmethod
+    def _sum_quantities(quantity_texts) -> int:
+        """Sum the digits found in each quantity text.
+        
+        Args:
+            quantity_texts: Iterable of quantity strings (e.g. "12 available")
             
-        except Exception as e:
-            logger.warning(f"Error extracting quantity: {e}")
-            return None
+        Returns:
+            Total quantity (0 if no digits were found)
+        """
+        total_quantity = 0
+        for idx, quantity_text in enumerate(quantity_texts):
+            digits = ''.join(filter(str.isdigit, quantity_text))
+            if digits:
+                total_quantity += int(digits)
+                logger.debug("Added quantity from element %s: %s", idx, digits)
+        return total_quantity
     
-    def _clean_sku_text(self, part_number: str) -> str:
+    @staticmethod
+    def _clean_sku_text(part_number: str) -> str:
         """Clean SKU text by removing unwanted characters and whitespace."""
         if not part_number:
             return "N/A"
         
-        # Clean up the SKU text
-        prefixes = ["Vendor Part #:", "SKU:", "Part #:"]
-        for prefix in prefixes:
-            if prefix in part_number:
-                part_number = part_number.split(prefix)[-1].strip()
-                break
+        # Keep the text after the last occurrence of the first label found;
+        # rpartition scans once and avoids building a list like split() does
+        for prefix in _SKU_PREFIXES:
+            _, found, tail = part_number.rpartition(prefix)
+            if found:
+                return tail.strip()
         
         return part_number.strip()
     
@@ -362,18 +694,31 @@ class DataExtractor:
         url_found: bool
     ) -> None:
         """Fallback method for title and URL extraction."""
-        all_links = card_element.find_elements(By.TAG_NAME, "a")
-        
-        for link in all_links:
-            href = link.get_attribute("href")
-            link_text = link.text.strip()
-            
+        try:
+            links = self.element_finder.driver.execute_script(_LINKS_JS, card_element)
+        except WebDriverException:
+            links = [
+                (link.get_attribute("href"), _text_content(link))
+                for link in card_element.find_elements(By.TAG_NAME, "a")
+            ]
+        self._apply_fallback_links(links, result, title_found, url_found)
+    
+    @staticmethod
+    def _apply_fallback_links(
+        links: List[tuple],
+        result: ScrapingResult,
+        title_found: bool,
+        url_found: bool
+    ) -> None:
+        """Pick title and URL from a card's (href, text) link pairs."""
+        for href, link_text in links:
             # Skip invalid links
-            if not href or any(skip in href.lower() for skip in ['mailto:', 'tel:', 'javascript:', '#']):
+            href_lower = href.lower() if href else ""
+            if not href or any(skip in href_lower for skip in _SKIPPED_LINK_PARTS):
                 continue
             
             # Priority for product-like links
-            if any(indicator in href.lower() for indicator in ['/product/', '/item/', '/p/', '/details/']):
+            if any(indicator in href_lower for indicator in _PRODUCT_LINK_PARTS):
                 if not url_found:
                     result.url = href
                     url_found = True
@@ -385,10 +730,7 @@ class DataExtractor:
         
         # Last resort: use first meaningful link
         if not title_found or not url_found:
-            for link in all_links:
-                href = link.get_attribute("href")
-                link_text = link.text.strip()
-                
+            for href, link_text in links:
                 if href and link_text and len(link_text) > 5:
                     if not url_found:
                         result.url = href
@@ -398,40 +740,37 @@ class DataExtractor:
     
     def _fallback_sku_extraction(self, card_element: WebElement, result: ScrapingResult) -> None:
         """Fallback method for SKU extraction using regex patterns."""
-        all_text = card_element.text
-        sku_patterns = [
-            r'SKU:?\s*([A-Za-z0-9\-]+)',
-            r'Part\s*#:?\s*([A-Za-z0-9\-]+)',
-            r'Item\s*#:?\s*([A-Za-z0-9\-]+)',
-            r'Model:?\s*([A-Za-z0-9\-]+)'
-        ]
-        
-        for pattern in sku_patterns:
-            match = re.search(pattern, all_text, re.IGNORECASE)
+        self._apply_sku_patterns(_text_content(card_element), result)
+    
+    @staticmethod
+    def _apply_sku_patterns(all_text: str, result: ScrapingResult) -> None:
+        """Set part_number from the first common SKU pattern found in text."""
+        for pattern in _SKU_PATTERNS:
+            match = pattern.search(all_text)
             if match:
                 result.part_number = match.group(1)
-                logger.debug(f"Found SKU with pattern '{pattern}': {result.part_number}")
+                logger.debug("Found SKU with pattern '%s': %s", pattern.pattern, result.part_number)
                 break
     
     def _debug_product_structure(self, card_element: WebElement, card_index: int) -> None:
         """Debug function to understand product card structure."""
         try:
-            logger.debug(f"\n=== DEBUGGING PRODUCT CARD {card_index} ===")
+            logger.debug("\n=== DEBUGGING PRODUCT CARD %s ===", card_index)
             
             # Get outer HTML for inspection
             outer_html = card_element.get_attribute("outerHTML")
-            logger.debug(f"Card HTML (first 300 chars): {outer_html[:300]}...")
+            logger.debug("Card HTML (first 300 chars): %s...", outer_html[:300])
             
             # Find all links in the card
             links = card_element.find_elements(By.TAG_NAME, "a")
-            logger.debug(f"Found {len(links)} links in card:")
+            logger.debug("Found %s links in card:", len(links))
             for i, link in enumerate(links):
                 href = link.get_attribute("href")
                 text = link.text.strip()
                 classes = link.get_attribute("class")
-                logger.debug(f"  Link {i}: href='{href}', text='{text[:50]}', classes='{classes}'")
+                logger.debug("  Link %s: href='%s', text='%s', classes='%s'", i, href, text[:50], classes)
             
-            logger.debug(f"=== END DEBUG CARD {card_index} ===\n")
+            logger.debug("=== END DEBUG CARD %s ===\n", card_index)
             
         except Exception as e:
-            logger.error(f"Debug error for card {card_index}: {e}")
\ No newline at end of file
+            logger.error("Debug error for card %s: %s", card_index, e)
\ No newline at end of file
@@ -1,17 +1,101 @@
 """Element finding utilities for web scraping."""
 
 import logging
-from typing import List, Optional, Union
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Union
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 
 logger = logging.getLogger(__name__)
 
+# querySelectorAll in document order, cut to the first N before any element
+# reference is serialized back to the driver
+_FIRST_N_ELEMENTS_JS = (
+    "return Array.prototype.slice.call("
+    "(arguments[2] || document).querySelectorAll(arguments[0]), 0, arguments[1]);"
+)
+
+@contextmanager
+def no_implicit_wait(driver: WebDriver, restore_to: Optional[float] = None):
+    """Temporarily disable the driver's implicit wait.
+    
+    Every failed find_element in a selector-fallback loop otherwise blocks for
+    the full implicit timeout before the next selector is tried.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        restore_to: Implicit wait (seconds) to restore on exit; read from the
+            driver if None
+    """
+    if restore_to is None:
+        restore_to = driver.timeouts.implicit_wait
+    
+    if not restore_to:
+        yield
+        return
+    
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(restore_to)
+
+
+class SelectorCache:
+    """Skips page-level fallback selectors that keep missing.
+    
+    Fallback lists are first-match-wins in configured priority, so nothing is
+    ever promoted: ordered() keeps the configured order and only leaves out
+    selectors that missed MISS_LIMIT lookups in a row while a lower-priority
+    selector matched. Lookups inside a product card don't use the cache;
+    cards differ, and skipping there would make one card's result depend on
+    the cards before it.
+    
+    The state lives only as long as the owning ElementFinder; the configured
+    selector lists are never modified.
+    """
+    
+    MISS_LIMIT = 3
+    
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._miss_streaks: Dict[Tuple[str, ...], Dict[str, int]] = {}
+    
+    def ordered(self, selectors: List[str]) -> List[str]:
+        """Return selectors in configured order, minus consistent misses.
+        
+        Args:
+            selectors: Fallback selector list in configured order
+            
+        Returns:
+            Selectors in the order they should be tried (the full list if
+            every selector would be skipped)
+        """
+        streaks = self._miss_streaks.get(tuple(selectors))
+        if not streaks:
+            return list(selectors)
+        remaining = [selector for selector in selectors if streaks.get(selector, 0) < self.MISS_LIMIT]
+        return remaining or list(selectors)
+    
+    def record(self, selectors: List[str], selector: str) -> None:
+        """Record that ``selector`` matched and every selector before it missed.
+        
+        Args:
+            selectors: Fallback selector list that was searched
+            selector: Selector that produced a match
+        """
+        streaks = self._miss_streaks.setdefault(tuple(selectors), {})
+        for candidate in selectors:
+            if candidate == selector:
+                streaks.pop(candidate, None)
+                break
+            streaks[candidate] = streaks.get(candidate, 0) + 1
+
 
 class ElementFinder:
     """Handles finding web elements using multiple selector strategies."""
@@ -25,6 +109,33 @@ class ElementFinder:
         """
         self.driver = driver
         self.default_timeout = default_timeout
+        self._implicit_wait: Optional[float] = None
+        self._no_wait_depth = 0
+        self.selector_cache = SelectorCache()
+    
+    @contextmanager
+    def without_implicit_wait(self):
+        """Disable implicit wait for the enclosed block (re-entrant).
+        
+        Nested uses only toggle the driver timeout at the outermost level.
+        """
+        if self._no_wait_depth:
+            self._no_wait_depth += 1
+            try:
+                yield
+            finally:
+                self._no_wait_depth -= 1
+            return
+        
+        if self._implicit_wait is None:
+            self._implicit_wait = self.driver.timeouts.implicit_wait
+        
+        self._no_wait_depth = 1
+        try:
+            with no_implicit_wait(self.driver, self._implicit_wait):
+                yield
+        finally:
+            self._no_wait_depth = 0
     
     def find_element_with_selectors(
         self,
@@ -36,6 +147,10 @@ class ElementFinder:
     ) -> Optional[WebElement]:
         """Find element using multiple selectors as fallbacks.
         
+        Page-level searches poll every selector together, in priority order,
+        under a single timeout; a missing element costs one timeout rather
+        than one per selector.
+        
         Args:
             selectors: Single selector string or list of selectors to try
             by: Selenium By strategy (default: CSS_SELECTOR)
@@ -50,56 +165,64 @@ class ElementFinder:
             selectors = [selectors]
         
         timeout = timeout or self.default_timeout
-        search_context = parent_element or self.driver
+        # Card-level lookups keep the configured order (see SelectorCache)
+        ordered_selectors = list(selectors) if parent_element else self.selector_cache.ordered(selectors)
         
-        for selector in selectors:
-            try:
+        def first_match(search_context):
+            for selector in ordered_selectors:
+                for element in search_context.find_elements(by, selector)[:1]:
+                    if not wait_for_clickable or (element.is_displayed() and element.is_enabled()):
+                        return selector, element
+            return False
+        
+        try:
+            with self.without_implicit_wait():
                 if parent_element:
-                    # For parent element searches, use direct find
-                    if wait_for_clickable:
-                        # Can't use WebDriverWait with parent element for clickable
-                        element = search_context.find_element(by, selector)
-                        if element.is_enabled() and element.is_displayed():
-                            logger.debug(f"Found clickable element with selector: {selector}")
-                            return element
-                    else:
-                        element = search_context.find_element(by, selector)
-                        logger.debug(f"Found element with selector: {selector}")
-                        return element
+                    # Card-level lookups: the card is already rendered, don't wait
+                    match = first_match(parent_element)
                 else:
-                    # For driver searches, use WebDriverWait
-                    condition = (
-                        EC.element_to_be_clickable((by, selector))
-                        if wait_for_clickable
-                        else EC.presence_of_element_located((by, selector))
-                    )
-                    
-                    element = WebDriverWait(search_context, timeout).until(condition)
-                    logger.debug(f"Found element with selector: {selector}")
-                    return element
-                    
-            except (TimeoutException, NoSuchElementException):
-                logger.debug(f"Selector failed: {selector}")
-                continue
-            except Exception as e:
-                logger.warning(f"Error with selector {selector}: {e}")
-                continue
+                    match = WebDriverWait(
+                        self.driver, timeout,
+                        ignored_exceptions=(StaleElementReferenceException,)
+                    ).until(first_match)
+        except TimeoutException:
+            match = None
+        except Exception as e:
+            logger.warning("Error with selectors %s: %s", selectors, e)
+            match = None
+        
+        if match:
+            selector, element = match
+            logger.debug("Found element with selector: %s", selector)
+            if not parent_element:
+                self.selector_cache.record(selectors, selector)
+            return element
         
-        logger.warning(f"Could not find element with any of the provided selectors: {selectors}")
+        # Misses inside a card are routine (optional fields); page-level misses are not
+        logger.log(
+            logging.DEBUG if parent_element else logging.WARNING,
+            "Could not find element with any of the provided selectors: %s", selectors
+        )
         return None
     
     def find_elements_with_selectors(
         self,
         selectors: Union[str, List[str]],
         by: By = By.CSS_SELECTOR,
-        parent_element: Optional[WebElement] = None
+        parent_element: Optional[WebElement] = None,
+        limit: Optional[int] = None
     ) -> List[WebElement]:
         """Find multiple elements using selectors as fallbacks.
         
+        Every returned WebElement is a reference the driver has to register
+        and serialize, so with ``limit`` CSS matches are truncated in the
+        browser rather than after the round trip.
+        
         Args:
             selectors: Single selector string or list of selectors to try
             by: Selenium By strategy (default: CSS_SELECTOR)
             parent_element: Search within this element instead of entire page
+            limit: Return at most this many elements (all if None)
             
         Returns:
             List of found WebElements (empty if none found)
@@ -108,20 +231,64 @@ class ElementFinder:
             selectors = [selectors]
         
         search_context = parent_element or self.driver
+        ordered_selectors = list(selectors) if parent_element else self.selector_cache.ordered(selectors)
         
-        for selector in selectors:
+        for selector in ordered_selectors:
             try:
-                elements = search_context.find_elements(by, selector)
+                with self.without_implicit_wait():
+                    if limit is not None and by == By.CSS_SELECTOR:
+                        elements = self.driver.execute_script(
+                            _FIRST_N_ELEMENTS_JS, selector, limit, parent_element
+                        )
+                    else:
+                        elements = search_context.find_elements(by, selector)[:limit]
                 if elements:
-                    logger.debug(f"Found {len(elements)} elements with selector: {selector}")
+                    logger.debug("Found %s elements with selector: %s", len(elements), selector)
+                    if not parent_element:
+                        self.selector_cache.record(selectors, selector)
                     return elements
             except Exception as e:
-                logger.warning(f"Error with selector {selector}: {e}")
+                logger.warning("Error with selector %s: %s", selector, e)
                 continue
         
-        logger.debug(f"Could not find elements with any selector: {selectors}")
+        logger.debug("Could not find elements with any selector: %s", selectors)
         return []
     
+    def wait_for_any(
+        self,
+        selectors: Union[str, List[str]],
+        by: By = By.CSS_SELECTOR,
+        timeout: Optional[int] = None
+    ) -> bool:
+        """Wait until an element matching any of the selectors is present.
+        
+        Unlike find_element_with_selectors, all selectors are polled together,
+        so this returns as soon as the first one matches.
+        
+        Args:
+            selectors: Single selector string or list of selectors to watch
+            by: Selenium By strategy (default: CSS_SELECTOR)
+            timeout: Custom timeout (uses default if None)
+            
+        Returns:
+            True if any selector matched, False on timeout
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        
+        timeout = timeout or self.default_timeout
+        
+        try:
+            # Each poll must miss fast, or every selector stalls for the implicit wait
+            with self.without_implicit_wait():
+                WebDriverWait(self.driver, timeout).until(
+                    EC.any_of(*[EC.presence_of_element_located((by, selector)) for selector in selectors])
+                )
+            return True
+        except TimeoutException:
+            logger.debug("None of the selectors appeared within %ss: %s", timeout, selectors)
+            return False
+    
     def check_element_exists(
         self,
         selectors: Union[str, List[str]],
@@ -154,6 +321,9 @@ class ElementFinder:
     ) -> bool:
         """Wait for element to disappear from the page.
         
+        All selectors are polled together under one timeout, so a selector
+        that never disappears no longer delays checking the others.
+        
         Args:
             selectors: Single selector string or list of selectors to check
             by: Selenium By strategy (default: CSS_SELECTOR)
@@ -167,17 +337,15 @@ class ElementFinder:
         
         timeout = timeout or self.default_timeout
         
-        for selector in selectors:
-            try:
+        try:
+            with self.without_implicit_wait():
                 WebDriverWait(self.driver, timeout).until(
-                    EC.invisibility_of_element_located((by, selector))
+                    EC.any_of(*[EC.invisibility_of_element_located((by, selector)) for selector in selectors])
                 )
-                logger.debug(f"Element disappeared: {selector}")
-                return True
-            except TimeoutException:
-                continue
-            except Exception as e:
-                logger.warning(f"Error waiting for element to disappear {selector}: {e}")
-                continue
-        
-        return False
\ No newline at end of file
+            logger.debug("Element disappeared: %s", selectors)
+            return True
+        except TimeoutException:
+            return False
+        except Exception as e:
+            logger.warning("Error waiting for element to disappear %s: %s", selectors, e)
+            return False
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""In-process product extraction from results page HTML using lxml."""
+
+import logging
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import lxml.html
+    from lxml.html import HtmlElement
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    HtmlElement = None
+    LXML_AVAILABLE = False
+
+from config.config_models import ScrapingConfig
+from .data_extractor import DataExtractor, ScrapingResult, _CHECK_TABLE, _CHECK_RE
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _compiled_selector(selector: str) -> "CSSSelector":
+    """Translate a CSS selector to compiled XPath once per process."""
+    return CSSSelector(selector)
+
+
+class HtmlDataExtractor(DataExtractor):
+    """Extracts product data from the page source instead of live WebElements.
+
+    Mirrors the Selenium extraction rules of DataExtractor (selector fallback
+    order, SKU/price/quantity handling) but runs entirely in-process, so a
+    page of cards costs a single WebDriver round trip to fetch the HTML.
+    CSS selectors are compiled to XPath once and reused across pages.
+    """
+
+    def __init__(self):
+        """Initialize HTML data extractor."""
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml not installed. Install with: pip install lxml cssselect")
+        super().__init__(None)
+
+    def extract_from_page(
+        self,
+        page_html: str,
+        scraping_config: ScrapingConfig,
+        base_url: Optional[str] = None
+    ) -> List[ScrapingResult]:
+        """Extract every product card from a full results page's HTML.
+
+        Args:
+            page_html: Page source of the search results page
+            scraping_config: Configuration for scraping selectors
+            base_url: Page URL used to resolve relative links
+
+        Returns:
+            List of ScrapingResult objects, up to max_results_per_query
+            (empty if no product card selector matched)
+        """
+        document = lxml.html.fromstring(page_html)
+        if base_url:
+            document.make_links_absolute(base_url)
+
+        cards = self._select_all(document, scraping_config.product_card_selectors)
+        return [
+            self._extract_from_card(card, scraping_config, i+1)
+            for i, card in enumerate(cards[:scraping_config.max_results_per_query])
+        ]
+
+    def _extract_from_card(
+        self,
+        card: HtmlElement,
+        scraping_config: ScrapingConfig,
+        card_index: int
+    ) -> ScrapingResult:
+        """Extract product data from a parsed product card element."""
+        result = ScrapingResult()
+
+        try:
+            self._extract_title_and_url_from_html(card, scraping_config, result)
+            self._extract_part_numbers_from_html(card, scraping_config, result)
+            self._extract_price_from_card_html(card, scraping_config, result)
+
+            quantity_elements = self._select_all(card, scraping_config.product_quantity_selectors)
+            total_quantity = self._sum_quantities(self._text(el) for el in quantity_elements)
+            if total_quantity > 0:
+                result.quantity = str(total_quantity)
+
+            for badge in self._select_all(card, scraping_config.badges_selectors):
+                text = self._text(badge).lower()
+                if text == "partial match":
+                    result.partial_match = True
+                elif text == "cross ref match":
+                    result.cross_ref_match = True
+            result.exact_match = any(
+                self._text(badge).lower() == "exact match"
+                for badge in self._select_all(card, scraping_config.exact_match_selectors)
+            )
+
+        except Exception as e:
+            logger.error("Error extracting HTML data from product %s: %s", card_index, e)
+
+        return result
+
+    def _extract_title_and_url_from_html(
+        self,
+        card: HtmlElement,
+        scraping_config: ScrapingConfig,
+        result: ScrapingResult
+    ) -> None:
+        """Extract title and URL from parsed card HTML."""
+        title_found = url_found = False
+
+        for title_selector in scraping_config.product_title_selectors:
+            title_element = self._select_first(card, [title_selector])
+            if title_element is not None and self._text(title_element):
+                result.title = self._text(title_element)
+                title_found = True
+                break
+
+        link_element = self._select_first(card, [scraping_config.product_link_selector])
+        if link_element is not None and link_element.get("href"):
+            result.url = link_element.get("href")
+            url_found = True
+            if not title_found and self._text(link_element):
+                result.title = self._text(link_element)
+                title_found = True
+
+        if not title_found or not url_found:
+            links = [(link.get("href"), self._text(link)) for link in card.iter("a")]
+            self._apply_fallback_links(links, result, title_found, url_found)
+
+    def _extract_part_numbers_from_html(
+        self,
+        card: HtmlElement,
+        scraping_config: ScrapingConfig,
+        result: ScrapingResult
+    ) -> None:
+        """Extract part numbers (SKU) from parsed card HTML."""
+        sku_elements = self._select_all(card, scraping_config.product_sku_selectors)
+
+        if len(sku_elements) > 0:
+            part_number = self._sku_from_element(sku_elements[0])
+            if part_number and part_number.strip():
+                result.part_number = self._clean_sku_text(part_number)
+
+        if len(sku_elements) > 1:
+            vendor_part_number = self._sku_from_element(sku_elements[1])
+            if vendor_part_number and vendor_part_number.strip():
+                result.vendor_part_number = self._clean_sku_text(vendor_part_number)
+
+        if result.part_number == "N/A":
+            self._apply_sku_patterns(card.text_content(), result)
+
+    def _extract_price_from_card_html(
+        self,
+        card: HtmlElement,
+        scraping_config: ScrapingConfig,
+        result: ScrapingResult
+    ) -> None:
+        """Extract price from parsed card HTML."""
+        for price_selector in scraping_config.product_price_selectors:
+            price_element = self._select_first(card, [price_selector])
+            if price_element is None:
+                continue
+
+            price = self._text(price_element)
+            if "price-wrapper" in (price_element.get("class") or ""):
+                # No stylesheet here to hide d-none spans; skip them explicitly
+                price_parts = [
+                    text for text in (
+                        self._text(span) for span in self._select_all(price_element, ["span:not(.d-none)"])
+                    )
+                    if text and not text.startswith("(") and not text.endswith(")")
+                ]
+                if len(price_parts) >= 2:
+                    price = f"{price_parts[0].replace('$', '')}.{price_parts[1]}"
+
+            if price:
+                result.price = price
+                break
+
+    def _sku_from_element(self, sku_element: HtmlElement) -> str:
+        """Extract SKU from the nested span / hidden input structures."""
+        hidden_input = self._select_first(sku_element, ["input[name='sku-id']"])
+        if hidden_input is not None:
+            return hidden_input.get("value") or ""
+
+        vendor_value = self._select_first(sku_element, ["span.vendor-value"])
+        if vendor_value is not None:
+            sku_parts = [
+                text for text in (
+                    self._text(span) for span in self._select_all(vendor_value, ["span:not(.d-none)"])
+                )
+                if text and not _CHECK_RE.search(text)
+            ]
+            if sku_parts:
+                return ''.join(sku_parts)
+
+        return self._text(sku_element).translate(_CHECK_TABLE).strip()
+
+    @staticmethod
+    def _text(element: HtmlElement) -> str:
+        """Return whitespace-collapsed text content, like the other extraction tiers."""
+        return " ".join(element.text_content().split())
+
+    @staticmethod
+    def _select_all(root: HtmlElement, selectors: List[str]) -> List[HtmlElement]:
+        """Return descendant matches of the first selector that matches anything."""
+        for selector in selectors:
+            try:
+                # cssselect also matches the root itself; WebElement lookups don't
+                elements = [el for el in _compiled_selector(selector)(root) if el is not root]
+            except Exception as e:
+                logger.debug("Unsupported selector for lxml %s: %s", selector, e)
+                continue
+            if elements:
+                return elements
+        return []
+
+    @classmethod
+    def _select_first(cls, root: HtmlElement, selectors: List[str]) -> Optional[HtmlElement]:
+        """Return the first element matched by the first matching selector."""
+        elements = cls._select_all(root, selectors)
+        return elements[0] if elements else None
@@ -1,7 +1,6 @@
 """Page interaction utilities for web scraping."""
 
 import os
-import time
 import logging
 from datetime import datetime
 from typing import List, Optional
@@ -10,7 +9,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 from .element_finder import ElementFinder
 
@@ -34,6 +33,9 @@ class PageInteractionHandler:
         ".overlay.show",
         ".modal-overlay.show"
     ]
+    # Any visible modal is handled regardless of which pattern matched, so one
+    # union query replaces a find_elements round trip per pattern
+    MODAL_SELECTOR = ", ".join(MODAL_SELECTORS)
     
     # Close button selectors for modals
     CLOSE_BUTTON_SELECTORS = [
@@ -57,6 +59,7 @@ class PageInteractionHandler:
         "[data-loading='true']",
         ".loading-overlay"
     ]
+    LOADING_SELECTOR = ", ".join(LOADING_SELECTORS)
     
     def __init__(self, driver: WebDriver, element_finder: ElementFinder):
         """Initialize page interaction handler.
@@ -71,25 +74,29 @@ class PageInteractionHandler:
     def wait_for_page_load(self, timeout: int = 10) -> None:
         """Wait for page to fully load and handle loading states.
         
+        driver.get() already blocks until the configured page load strategy
+        is satisfied (DOMContentLoaded for "eager"), so no readyState polling
+        is done here; only client-side loading indicators are waited on.
+        
         Args:
-            timeout: Maximum time to wait for page load
+            timeout: Maximum time to wait for loading indicators to disappear
         """
+        def no_visible_loader(driver) -> bool:
+            loaders = driver.find_elements(By.CSS_SELECTOR, self.LOADING_SELECTOR)
+            return not any(loader.is_displayed() for loader in loaders)
+        
         try:
-            # Wait for document ready state
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            
-            # Wait for loading indicators to disappear
-            for selector in self.LOADING_SELECTORS:
-                self.element_finder.wait_for_element_to_disappear(
-                    selector, timeout=3
-                )
-            
+            with self.element_finder.without_implicit_wait():
+                WebDriverWait(
+                    self.driver, min(timeout, 3), poll_frequency=0.1,
+                    ignored_exceptions=(StaleElementReferenceException,)
+                ).until(no_visible_loader)
             logger.debug("Page load completed")
             
+        except TimeoutException:
+            logger.warning("Loading indicators still visible after %ss", min(timeout, 3))
         except Exception as e:
-            logger.warning(f"Page load wait issue: {e}")
+            logger.warning("Page load wait issue: %s", e)
     
     def handle_modal_popups(self) -> bool:
         """Handle common modal popups that might interfere with scraping.
@@ -99,29 +106,26 @@ class PageInteractionHandler:
         """
         try:
             # Find visible modals
-            for modal_selector in self.MODAL_SELECTORS:
-                modals = self.element_finder.find_elements_with_selectors(modal_selector)
+            for modal in self.element_finder.find_elements_with_selectors(self.MODAL_SELECTOR):
+                if not modal.is_displayed():
+                    continue
+                
+                logger.info("Found visible modal")
                 
-                for modal in modals:
-                    if not modal.is_displayed():
-                        continue
-                    
-                    logger.info(f"Found visible modal: {modal_selector}")
-                    
-                    # Try to find and click close button within modal
-                    if self._close_modal_with_button(modal):
-                        return True
-                    
-                    # Try to hide modal with JavaScript
-                    if self._hide_modal_with_js(modal):
-                        return True
+                # Try to find and click close button within modal
+                if self._close_modal_with_button(modal):
+                    return True
+                
+                # Try to hide modal with JavaScript
+                if self._hide_modal_with_js(modal):
+                    return True
             
             # Try pressing Escape key as fallback
             self._try_escape_key()
             return False
             
         except Exception as e:
-            logger.error(f"Error handling modals: {e}")
+            logger.error("Error handling modals: %s", e)
             return False
     
     def take_screenshot(self, filename: str, description: str = "") -> Optional[str]:
@@ -143,11 +147,11 @@ class PageInteractionHandler:
             filepath = os.path.join(screenshot_dir, f"{filename}_{timestamp}.png")
             
             self.driver.save_screenshot(filepath)
-            logger.info(f"Screenshot saved: {filepath} ({description})")
+            logger.info("Screenshot saved: %s (%s)", filepath, description)
             return filepath
             
         except Exception as e:
-            logger.error(f"Failed to take screenshot: {e}")
+            logger.error("Failed to take screenshot: %s", e)
             return None
     
     def scroll_to_element(self, element) -> None:
@@ -157,10 +161,10 @@ class PageInteractionHandler:
             element: WebElement to scroll to
         """
         try:
+            # Instant (non-smooth) scroll completes before the script returns
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Brief pause for scroll to complete
         except Exception as e:
-            logger.warning(f"Error scrolling to element: {e}")
+            logger.warning("Error scrolling to element: %s", e)
     
     def click_element_safely(self, element) -> bool:
         """Safely click an element with multiple fallback strategies.
@@ -184,7 +188,7 @@ class PageInteractionHandler:
             self.driver.execute_script("arguments[0].click();", element)
             return True
         except Exception as e:
-            logger.warning(f"Failed to click element: {e}")
+            logger.warning("Failed to click element: %s", e)
             return False
     
     def _close_modal_with_button(self, modal) -> bool:
@@ -205,7 +209,7 @@ class PageInteractionHandler:
                         if any(x in btn.text for x in ["×", "X", "Close"]):
                             if self.click_element_safely(btn):
                                 logger.info("Closed modal using X button")
-                                time.sleep(1)
+                                self._wait_for_modal_to_close(modal)
                                 return True
                 else:
                     close_button = self.element_finder.find_element_with_selectors(
@@ -213,8 +217,8 @@ class PageInteractionHandler:
                     )
                     if close_button and close_button.is_displayed():
                         if self.click_element_safely(close_button):
-                            logger.info(f"Closed modal using: {close_selector}")
-                            time.sleep(1)
+                            logger.info("Closed modal using: %s", close_selector)
+                            self._wait_for_modal_to_close(modal)
                             return True
                             
             except Exception:
@@ -234,7 +238,6 @@ class PageInteractionHandler:
         try:
             self.driver.execute_script("arguments[0].style.display = 'none';", modal)
             logger.info("Hid modal using JavaScript")
-            time.sleep(1)
             return True
         except Exception:
             return False
@@ -242,9 +245,22 @@ class PageInteractionHandler:
     def _try_escape_key(self) -> None:
         """Try pressing Escape key to close modals."""
         try:
-            body = self.driver.find_element(By.TAG_NAME, 'body')
-            body.send_keys(Keys.ESCAPE)
-            logger.debug("Attempted to close modals with Escape key")
-            time.sleep(1)
+            for body in self.driver.find_elements(By.TAG_NAME, 'body')[:1]:
+                body.send_keys(Keys.ESCAPE)
+                logger.debug("Attempted to close modals with Escape key")
         except Exception:
-            pass
\ No newline at end of file
+            pass
+    
+    def _wait_for_modal_to_close(self, modal, timeout: int = 2) -> None:
+        """Wait for a dismissed modal to be hidden or removed from the DOM.
+        
+        Args:
+            modal: Modal WebElement
+            timeout: Maximum time to wait for the close animation
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                EC.invisibility_of_element(modal)
+            )
+        except TimeoutException:
+            logger.debug("Modal still visible after %ss", timeout)
\ No newline at end of file
@@ -1,37 +1,127 @@
 """Main scraper facade providing backward compatibility and easy usage."""
 
-import json
 import time
+import queue
+import atexit
+import asyncio
 import logging
+import threading
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from contextlib import contextmanager, ExitStack
 
 from config.config_models import SiteConfig, ChromeConfig
 from config.config_loader import ConfigLoader
+from llm import json_codec
 from .web_driver_manager import WebDriverManager
 from .web_scraper import WebScraper
+from .browser_pool import BrowserPool
+from .search_api_client import SearchApiClient
+from . import async_scraper
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
+# Per-process WebDriver and scraper used by parallel scrape workers
+_worker_driver = None
+_worker_scraper = None
+
+# Process-wide driver shared by the backward compatibility helpers
+_shared_driver = None
+_shared_driver_lock = threading.Lock()
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode an object as one compact NDJSON line."""
+    return json_codec.dumps(obj) + b"\n"
+
+
+def _sleep_remaining(started: float, min_interval: float) -> None:
+    """Sleep until min_interval seconds have passed since ``started``.
+    
+    delay_between_searches is a rate limit between search starts; time
+    already spent scraping counts towards it instead of being added on top.
+    
+    Args:
+        started: time.monotonic() taken when the search started
+        min_interval: Minimum seconds between consecutive search starts
+    """
+    remaining = min_interval - (time.monotonic() - started)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _init_worker_driver(chrome_config: ChromeConfig, worker_counter) -> None:
+    """Start one browser per worker process, staggering startups by 100 ms.
+    
+    Args:
+        chrome_config: Chrome configuration for the worker's driver
+        worker_counter: Shared multiprocessing.Value used to number workers
+    """
+    global _worker_driver, _worker_scraper
+    
+    with worker_counter.get_lock():
+        worker_index = worker_counter.value
+        worker_counter.value += 1
+    
+    # Stagger workers so they don't hit the target site at the same instant
+    time.sleep(worker_index * 0.1)
+    
+    _worker_driver = WebDriverManager(chrome_config).create_driver()
+    if _worker_driver:
+        # atexit does not run in pool workers; multiprocessing finalizers do
+        multiprocessing.util.Finalize(None, _worker_driver.quit, exitpriority=10)
+        _worker_scraper = WebScraper(_worker_driver)
+
+
+def _scrape_one(task) -> List[Dict[str, Any]]:
+    """Scrape one search term with the worker's driver.
+    
+    Args:
+        task: Tuple of (search_term, site_config, debug_mode, delay_between_searches)
+        
+    Returns:
+        List of scraped product data
+    """
+    search_term, site_config, debug_mode, delay_between_searches = task
+    started = time.monotonic()
+    
+    if _worker_scraper is None:
+        logger.error("No WebDriver available in worker for '%s'", search_term)
+        return []
+    
+    try:
+        return _worker_scraper.scrape_next(search_term, site_config, debug_mode)
+    except Exception as e:
+        logger.error("Error scraping '%s': %s", search_term, e)
+        return []
+    finally:
+        # Keep each worker's request rate the same as a sequential run
+        _sleep_remaining(started, delay_between_searches)
+
+
 class ScraperFacade:
     """Main facade class for web scraping operations."""
     
-    def __init__(self, chrome_config: Optional[ChromeConfig] = None):
+    def __init__(
+        self,
+        chrome_config: Optional[ChromeConfig] = None,
+        browser_pool: Optional[BrowserPool] = None
+    ):
         """Initialize scraper facade.
         
         Args:
             chrome_config: Optional Chrome configuration (uses default if None)
+            browser_pool: Optional shared pool to lease drivers from instead of
+                starting a new browser for every run
         """
         self.chrome_config = chrome_config or ConfigLoader.load_default_chrome_config()
         self.driver_manager = WebDriverManager(self.chrome_config)
+        self.browser_pool = browser_pool
         self._driver = None
         self._scraper = None
     
@@ -42,6 +132,11 @@ class ScraperFacade:
         Yields:
             WebScraper instance with managed driver lifecycle
         """
+        if self.browser_pool:
+            with self.browser_pool.lease() as driver:
+                yield WebScraper(driver)
+            return
+        
         driver = None
         try:
             driver = self.driver_manager.create_driver()
@@ -73,26 +168,280 @@ class ScraperFacade:
         Returns:
             Dictionary mapping search terms to their results
         """
-        all_results = {}
+        return dict(self.iter_scrape_with_config(
+            search_terms, site_config, debug_mode, delay_between_searches
+        ))
+    
+    def iter_scrape_with_config(
+        self,
+        search_terms: List[str],
+        site_config: SiteConfig,
+        debug_mode: bool = False,
+        delay_between_searches: int = 2
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Scrape search terms one at a time, yielding each term's results.
         
-        with self.get_scraper() as scraper:
-            for search_term in search_terms:
-                logger.info(f"Starting scrape for: {search_term}")
+        Args:
+            search_terms: List of search terms to scrape
+            site_config: Site configuration to use
+            debug_mode: Whether to enable debug mode
+            delay_between_searches: Delay between searches in seconds
+            
+        Yields:
+            (search_term, results) tuples in input order
+        """
+        search_api = SearchApiClient(site_config.scraping_config, self.chrome_config.user_agent)
+        
+        with ExitStack() as stack:
+            stack.callback(search_api.close)
+            scraper = None
+            
+            for index, search_term in enumerate(search_terms):
+                logger.info("Starting scrape for: %s", search_term)
+                started = time.monotonic()
                 
                 try:
-                    results = scraper.scrape_site(search_term, site_config, debug_mode)
-                    all_results[search_term] = results
-                    logger.info(f"Finished scrape for: {search_term}, Found {len(results)} results")
+                    results = search_api.search(search_term)
+                    if results is None:
+                        # Start the browser only once the API can't serve a term
+                        if scraper is None:
+                            scraper = stack.enter_context(self.get_scraper())
+                        results = scraper.scrape_next(search_term, site_config, debug_mode)
+                    logger.info("Finished scrape for: %s, Found %s results", search_term, len(results))
                     
                 except Exception as e:
-                    logger.error(f"Error scraping '{search_term}': {e}")
-                    all_results[search_term] = []
+                    logger.error("Error scraping '%s': %s", search_term, e)
+                    results = []
+                
+                yield search_term, results
                 
                 # Delay between searches to be respectful
-                if search_term != search_terms[-1]:  # Don't delay after last search
-                    time.sleep(delay_between_searches)
+                if index < len(search_terms) - 1:  # Don't delay after last search
+                    _sleep_remaining(started, delay_between_searches)
+    
+    def stream_results_to_file(
+        self,
+        search_terms: List[str],
+        site_config: SiteConfig,
+        output_file: Optional[str] = None,
+        debug_mode: bool = False,
+        delay_between_searches: int = 2
+    ) -> str:
+        """Scrape search terms and append each term's results as one NDJSON line.
+        
+        Memory stays bounded by a single query's results, and a crash mid-run
+        keeps every query written so far.
+        
+        Args:
+            search_terms: List of search terms to scrape
+            site_config: Site configuration to use
+            output_file: Optional output filename (generates default if None)
+            debug_mode: Whether to enable debug mode
+            delay_between_searches: Delay between searches in seconds
+            
+        Returns:
+            Path to the NDJSON file
+        """
+        if not output_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"scraped_results_{timestamp}.ndjson"
+        
+        with open(output_file, "ab") as f:
+            for search_term, results in self.iter_scrape_with_config(
+                search_terms, site_config, debug_mode, delay_between_searches
+            ):
+                f.write(_dumps_line({search_term: results}))
+                f.flush()
+        
+        logger.info("Results streamed to %s", output_file)
+        return output_file
+    
+    def scrape_with_config_parallel(
+        self,
+        search_terms: List[str],
+        site_config: SiteConfig,
+        parallelism: int,
+        debug_mode: bool = False,
+        delay_between_searches: int = 2
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape search terms in parallel, one browser per worker.
+        
+        WebDriver is not thread-safe, so each worker owns its driver while it
+        scrapes. With a browser pool, worker threads lease the pool's already
+        running drivers; otherwise each worker process starts its own.
+        
+        Args:
+            search_terms: List of search terms to scrape
+            site_config: Site configuration to use
+            parallelism: Number of worker processes
+            debug_mode: Whether to enable debug mode
+            delay_between_searches: Delay between searches per worker in seconds
+            
+        Returns:
+            Dictionary mapping search terms to their results
+        """
+        if parallelism <= 1 or len(search_terms) <= 1:
+            return self.scrape_with_config(
+                search_terms, site_config, debug_mode, delay_between_searches
+            )
+        
+        if self.browser_pool:
+            return self._scrape_with_browser_pool(
+                search_terms, site_config, parallelism, debug_mode, delay_between_searches
+            )
+        
+        workers = min(parallelism, len(search_terms))
+        logger.info("Scraping %s search terms with %s worker processes", len(search_terms), workers)
+        
+        worker_counter = multiprocessing.Value('i', 0)
+        tasks = [
+            (search_term, site_config, debug_mode, delay_between_searches)
+            for search_term in search_terms
+        ]
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_driver,
+            initargs=(self.chrome_config, worker_counter)
+        ) as executor:
+            return dict(zip(search_terms, executor.map(_scrape_one, tasks)))
+    
+    def _scrape_with_browser_pool(
+        self,
+        search_terms: List[str],
+        site_config: SiteConfig,
+        parallelism: int,
+        debug_mode: bool,
+        delay_between_searches: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape search terms on worker threads that lease pooled drivers.
+        
+        Each worker keeps its lease for the whole run and pulls terms from a
+        shared queue, so after its first search it re-submits from the results
+        page instead of reloading the home page for every term.
+        """
+        workers = max(1, min(parallelism, self.browser_pool.live, len(search_terms)))
+        logger.info("Scraping %s search terms with %s pooled browsers", len(search_terms), workers)
+        
+        pending: "queue.Queue[str]" = queue.Queue()
+        for search_term in search_terms:
+            pending.put(search_term)
+        results: Dict[str, List[Dict[str, Any]]] = {}
         
-        return all_results
+        def worker() -> None:
+            with self.browser_pool.lease() as driver:
+                scraper = WebScraper(driver)
+                while True:
+                    try:
+                        search_term = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    started = time.monotonic()
+                    try:
+                        results[search_term] = scraper.scrape_next(search_term, site_config, debug_mode)
+                    except Exception as e:
+                        logger.error("Error scraping '%s': %s", search_term, e)
+                        results[search_term] = []
+                    if not pending.empty():
+                        _sleep_remaining(started, delay_between_searches)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Pooled scrape worker failed: %s", e)
+        
+        return {search_term: results.get(search_term, []) for search_term in search_terms}
+    
+    async def scrape_with_config_async(
+        self,
+        search_terms: List[str],
+        site_config: SiteConfig,
+        debug_mode: bool = False,
+        delay_between_searches: int = 2
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape search terms without blocking the running event loop.
+        
+        With a browser pool, one consumer per pooled driver pulls terms from
+        an asyncio.Queue and runs the blocking Selenium calls on a thread
+        pool sized to the browsers, so total time is roughly
+        ceil(terms / browsers) searches. Without a pool the sequential
+        scrape_with_config runs on a single worker thread.
+        
+        Args:
+            search_terms: List of search terms to scrape
+            site_config: Site configuration to use
+            debug_mode: Whether to enable debug mode
+            delay_between_searches: Delay between searches per browser in seconds
+            
+        Returns:
+            Dictionary mapping search terms to their results
+        """
+        loop = asyncio.get_running_loop()
+        
+        if not self.browser_pool or len(search_terms) <= 1:
+            return await loop.run_in_executor(
+                None, self.scrape_with_config,
+                search_terms, site_config, debug_mode, delay_between_searches
+            )
+        
+        workers = max(1, min(self.browser_pool.live, len(search_terms)))
+        logger.info("Scraping %s search terms with %s pooled browsers", len(search_terms), workers)
+        
+        pending: "asyncio.Queue[str]" = asyncio.Queue()
+        for search_term in search_terms:
+            pending.put_nowait(search_term)
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        
+        async def consume(executor: ThreadPoolExecutor) -> None:
+            driver = await loop.run_in_executor(executor, self.browser_pool.acquire)
+            try:
+                scraper = WebScraper(driver)
+                while not pending.empty():
+                    search_term = pending.get_nowait()
+                    started = loop.time()
+                    try:
+                        results[search_term] = await loop.run_in_executor(
+                            executor, scraper.scrape_next, search_term, site_config, debug_mode
+                        )
+                    except Exception as e:
+                        logger.error("Error scraping '%s': %s", search_term, e)
+                        results[search_term] = []
+                    if not pending.empty():
+                        await asyncio.sleep(max(0, delay_between_searches - (loop.time() - started)))
+            finally:
+                await loop.run_in_executor(executor, self.browser_pool.release, driver)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = await asyncio.gather(
+                *(consume(executor) for _ in range(workers)), return_exceptions=True
+            )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Pooled scrape worker failed: %s", outcome)
+        
+        return {search_term: results.get(search_term, []) for search_term in search_terms}
+    
+    def scrape_concurrently(
+        self,
+        search_terms: List[str],
+        site_config: SiteConfig,
+        concurrency: int = 4
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape multiple search terms concurrently using Playwright.
+        
+        Args:
+            search_terms: List of search terms to scrape
+            site_config: Site configuration to use
+            concurrency: Maximum number of queries scraped at once
+            
+        Returns:
+            Dictionary mapping search terms to their results
+        """
+        return asyncio.run(async_scraper.scrape_many_async(
+            search_terms, site_config, self.chrome_config, concurrency
+        ))
     
     def scrape_from_config_file(
         self,
@@ -116,14 +465,15 @@ class ScraperFacade:
             app_config = ConfigLoader.load_config_for_site(site_name, config_path)
             delay = app_config.deployment_config.delay_between_searches
             
-            return self.scrape_with_config(
+            return self.scrape_with_config_parallel(
                 search_terms, 
                 app_config.site_config, 
+                app_config.deployment_config.parallelism,
                 debug_mode,
                 delay
             )
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             return {}
     
     def save_results(
@@ -145,15 +495,19 @@ class ScraperFacade:
             output_file = f"scraped_results_{timestamp}.json"
         
         try:
-            with open(output_file, "w", encoding='utf-8') as f:
-                json.dump(results, f, indent=4, ensure_ascii=False)
-            logger.info(f"Results saved to {output_file}")
+            json_codec.dump_file(results, output_file)
+            logger.info("Results saved to %s", output_file)
             return output_file
         except Exception as e:
-            logger.error(f"Error saving results: {e}")
+            logger.error("Error saving results: %s", e)
             raise
 
 
+# Default configurations for the backward compatibility helpers, built once
+_DEFAULT_CHROME_CONFIG = ConfigLoader.load_default_chrome_config()
+_TRUCKPRO_DEFAULT_SITE_CONFIG = ConfigLoader.create_default_truckpro_config()
+
+
 # Backward compatibility functions
 def setup_driver_with_config(chrome_config: ChromeConfig):
     """Backward compatibility function for driver setup.
@@ -174,8 +528,43 @@ def setup_driver():
     Returns:
         WebDriver instance or None if setup failed
     """
-    chrome_config = ConfigLoader.load_default_chrome_config()
-    return setup_driver_with_config(chrome_config)
+    return setup_driver_with_config(_DEFAULT_CHROME_CONFIG)
+
+
+def get_shared_driver(chrome_config: Optional[ChromeConfig] = None):
+    """Return the process-wide driver, starting it on first use.
+    
+    Repeated scrape_tundra() calls then pay the browser startup once instead
+    of once per call. The driver is quit at interpreter exit.
+    
+    Args:
+        chrome_config: Chrome configuration used if the driver is not yet
+            running (defaults to the standard config)
+        
+    Returns:
+        WebDriver instance or None if setup failed
+    """
+    global _shared_driver
+    
+    if _shared_driver is None:
+        with _shared_driver_lock:
+            if _shared_driver is None:
+                _shared_driver = setup_driver_with_config(chrome_config or _DEFAULT_CHROME_CONFIG)
+    return _shared_driver
+
+
+@atexit.register
+def release_shared_driver() -> None:
+    """Quit the process-wide driver if one was started."""
+    global _shared_driver
+    
+    with _shared_driver_lock:
+        driver, _shared_driver = _shared_driver, None
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting shared WebDriver: %s", e)
 
 
 def scrape_site_with_config(
@@ -203,14 +592,18 @@ def scrape_tundra(driver, search_term: str) -> List[Dict[str, Any]]:
     """Backward compatibility function for TruckPro scraping.
     
     Args:
-        driver: Selenium WebDriver instance
+        driver: Selenium WebDriver instance, or None to use the shared driver
         search_term: Search term to scrape
         
     Returns:
         List of scraped product data
     """
-    site_config = ConfigLoader.create_default_truckpro_config()
-    return scrape_site_with_config(driver, search_term, site_config)
+    if driver is None:
+        driver = get_shared_driver()
+        if driver is None:
+            logger.error("No WebDriver available for '%s'", search_term)
+            return []
+    return scrape_site_with_config(driver, search_term, _TRUCKPRO_DEFAULT_SITE_CONFIG)
 
 
 # Main execution example
@@ -222,12 +615,17 @@ def main():
         
         search_queries = ["gasket", "BK608", "brake pads", "nonexistent_part"]
         
-        # Option 1: Using configuration file
-        results = facade.scrape_from_config_file(
-            search_queries, 
-            "truckpro",
-            debug_mode=False
-        )
+        # Option 1: Concurrent Playwright scraping when available
+        if async_scraper.PLAYWRIGHT_AVAILABLE:
+            app_config = ConfigLoader.load_config_for_site("truckpro")
+            results = facade.scrape_concurrently(search_queries, app_config.site_config)
+        else:
+            # Sequential Selenium scraping using configuration file
+            results = facade.scrape_from_config_file(
+                search_queries, 
+                "truckpro",
+                debug_mode=False
+            )
         
         # Option 2: Using direct configuration (commented out)
         # site_config = ConfigLoader.create_default_truckpro_config()
@@ -236,15 +634,19 @@ def main():
         # Save results
         output_file = facade.save_results(results)
         
-        # Print summary
-        print(f"\n=== SCRAPING SUMMARY ===")
+        # Log summary
+        logger.info("=== SCRAPING SUMMARY ===")
         for query, query_results in results.items():
-            print(f"{query}: {len(query_results)} results")
-        print(f"Results saved to: {output_file}")
+            logger.info("%s: %s results", query, len(query_results))
+        logger.info("Results saved to: %s", output_file)
         
     except Exception as e:
-        logger.error(f"Error in main execution: {e}")
+        logger.error("Error in main execution: %s", e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     main()
\ No newline at end of file
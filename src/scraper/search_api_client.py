@@ -0,0 +1,190 @@
+"""Direct HTTP client for a site's search endpoint or server-rendered search page."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote_plus
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.config_models import ScrapingConfig
+from llm import json_codec
+from .data_extractor import ScrapingResult
+from .html_extractor import HtmlDataExtractor, LXML_AVAILABLE
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchApiClient:
+    """Fetches search results from the JSON endpoint behind a site's search page.
+
+    Many storefronts render results from an XHR call. When a site config
+    records that endpoint, one HTTP request on a pooled session replaces the
+    browser round trip entirely. Sites that render results on the server can
+    instead set search_page_url; the HTML is parsed in-process with the same
+    card selectors the browser path uses. Callers fall back to Selenium when
+    search() returns None.
+    """
+
+    def __init__(
+        self,
+        scraping_config: ScrapingConfig,
+        user_agent: Optional[str] = None,
+        timeout: int = 10,
+        pool_size: int = 10
+    ):
+        """Initialize search API client.
+
+        Args:
+            scraping_config: Configuration holding the search_api_* settings
+            user_agent: Optional User-Agent header sent with every request
+            timeout: Request timeout in seconds
+            pool_size: Keep-alive connections kept per host, which bounds how
+                many searches search_many() can run at once without reconnecting
+        """
+        self.scraping_config = scraping_config
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept"] = "application/json"
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        self._html_extractor: Optional[HtmlDataExtractor] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the site config defines a search endpoint or search page."""
+        return bool(self.scraping_config.search_api_url or self._page_enabled)
+
+    @property
+    def _page_enabled(self) -> bool:
+        """Whether a server-rendered search page is configured and parseable."""
+        return bool(self.scraping_config.search_page_url) and LXML_AVAILABLE
+
+    def search(self, search_term: str) -> Optional[List[Dict[str, Any]]]:
+        """Run a search against the JSON endpoint or the static search page.
+
+        Args:
+            search_term: Term to search for
+
+        Returns:
+            List of product dictionaries in the scraper's output format, or
+            None if nothing is configured or the request failed
+        """
+        if self.scraping_config.search_api_url:
+            return self._search_json(search_term)
+        if self._page_enabled:
+            return self._search_page(search_term)
+        return None
+
+    def search_many(
+        self,
+        search_terms: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """Run several searches concurrently on the shared session.
+
+        Unlike a WebDriver, a requests Session can be used from several
+        threads, so the HTTP round trips of all terms overlap.
+
+        Args:
+            search_terms: Terms to search for
+            max_workers: Maximum concurrent requests (capped at pool_size)
+
+        Returns:
+            Dictionary mapping each term to search()'s result (None where the
+            caller should fall back to the browser)
+        """
+        workers = max(1, min(max_workers, self.pool_size, len(search_terms)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(search_terms, executor.map(self.search, search_terms)))
+
+    def _search_json(self, search_term: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch and map results from the JSON search endpoint."""
+        config = self.scraping_config
+        url = config.search_api_url.format(
+            query=quote_plus(search_term), limit=config.max_results_per_query
+        )
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            payload = json_codec.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
+            logger.warning("Search API request failed for '%s': %s", search_term, e)
+            return None
+
+        items = self._resolve(payload, config.search_api_results_path)
+        if not isinstance(items, list):
+            logger.warning("Search API response has no result list at '%s'", config.search_api_results_path)
+            return None
+
+        results = []
+        for item in items[:config.max_results_per_query]:
+            result = ScrapingResult()
+            for attribute, path in config.search_api_field_map.items():
+                value = self._resolve(item, path)
+                if value is not None and value != "":
+                    setattr(result, attribute, value if isinstance(value, bool) else str(value))
+            if result.is_valid():
+                results.append(result.to_dict())
+
+        logger.info("Search API returned %s results for '%s'", len(results), search_term)
+        return results
+
+    def _search_page(self, search_term: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the search results page and extract its cards without a browser.
+
+        Returns None when no product card is found, since that usually means
+        the results are rendered client-side (or it is a no-results page,
+        which the browser path detects properly).
+        """
+        config = self.scraping_config
+        url = config.search_page_url.format(
+            query=quote_plus(search_term), limit=config.max_results_per_query
+        )
+
+        try:
+            response = self.session.get(url, headers={"Accept": "text/html"}, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("Search page request failed for '%s': %s", search_term, e)
+            return None
+
+        if self._html_extractor is None:
+            self._html_extractor = HtmlDataExtractor()
+
+        try:
+            page_results = self._html_extractor.extract_from_page(response.text, config, response.url)
+        except Exception as e:
+            logger.warning("Could not parse search page for '%s': %s", search_term, e)
+            return None
+
+        if not page_results:
+            logger.info("No product cards in static HTML for '%s'; needs a browser", search_term)
+            return None
+
+        results = [result.to_dict() for result in page_results if result.is_valid()]
+        logger.info("Search page returned %s results for '%s'", len(results), search_term)
+        return results
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    @staticmethod
+    def _resolve(data: Any, path: str) -> Any:
+        """Follow a dotted path (e.g. "data.products") through dicts and lists."""
+        for key in filter(None, path.split(".")):
+            if isinstance(data, dict):
+                data = data.get(key)
+            elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+                data = data[int(key)]
+            else:
+                return None
+        return data
@@ -1,7 +1,10 @@
 """Web driver management module."""
 
+import os
 import logging
+from functools import lru_cache
 from typing import Optional
+import urllib3
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -12,6 +15,60 @@ from config.config_models import ChromeConfig
 logger = logging.getLogger(__name__)
 
 
+# Curated from Playwright's default Chromium switches
+PLAYWRIGHT_FLAGS = (
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-features=site-per-process,TranslateUI,BlinkGenPropertyTrees,ImprovedCookieControls",
+    "--disable-hang-monitor",
+    "--disable-ipc-flooding-protection",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--disable-renderer-backgrounding",
+    "--disable-sync",
+    "--force-color-profile=srgb",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--password-store=basic",
+    "--use-mock-keychain",
+)
+
+
+@lru_cache(maxsize=1)
+def _resolve_chromedriver_path() -> str:
+    """Locate chromedriver once per process.
+    
+    CHROME_DRIVER_PATH wins when set; otherwise webdriver-manager resolves
+    (and, on first use, downloads) a matching driver. Its version lookup is a
+    network round trip, so the result is memoized for every later driver.
+    
+    Raises:
+        ImportError: If webdriver-manager is needed but not installed
+    """
+    env_path = os.environ.get("CHROME_DRIVER_PATH")
+    if env_path:
+        return env_path
+    
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        raise ImportError(
+            "webdriver-manager not installed. Please install it "
+            "(`pip install webdriver-manager`) or specify chrome_driver_path in config."
+        )
+    
+    logger.info("Using webdriver-manager to install Chrome driver")
+    return ChromeDriverManager().install()
+
+
 class WebDriverManager:
     """Manages Selenium WebDriver setup and configuration."""
     
@@ -34,14 +91,15 @@ class WebDriverManager:
             options = self._create_chrome_options()
             service = self._create_service()
             
-            self._driver = webdriver.Chrome(service=service, options=options)
+            # Reuse one HTTP connection to chromedriver for all commands
+            self._driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self._configure_driver()
             
             logger.info("WebDriver setup successful")
             return self._driver
             
         except Exception as e:
-            logger.error(f"Error setting up WebDriver: {e}")
+            logger.error("Error setting up WebDriver: %s", e)
             return None
     
     def quit_driver(self) -> None:
@@ -51,7 +109,7 @@ class WebDriverManager:
                 self._driver.quit()
                 logger.info("WebDriver closed successfully")
             except Exception as e:
-                logger.error(f"Error closing WebDriver: {e}")
+                logger.error("Error closing WebDriver: %s", e)
             finally:
                 self._driver = None
     
@@ -67,45 +125,41 @@ class WebDriverManager:
         if self.chrome_config.headless:
             options.add_argument("--headless=new")
         
+        # "eager" returns from driver.get() at DOMContentLoaded instead of
+        # waiting for every image, stylesheet and subframe to load
+        options.page_load_strategy = self.chrome_config.page_load_strategy
+        
+        # WebDriver BiDi: a single WebSocket alongside the HTTP command channel,
+        # enabling driver.script / event-based APIs where supported
+        if self.chrome_config.enable_bidi:
+            options.set_capability("webSocketUrl", True)
+        
+        # Sandbox is usually unavailable inside containers
+        if self.chrome_config.no_sandbox:
+            options.add_argument("--no-sandbox")
+        
         # Security and stability arguments
         security_args = [
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
             "--disable-gpu-sandbox",
-            "--disable-software-rasterizer",
             "--disable-3d-apis",
             "--ignore-certificate-errors",
             "--ignore-ssl-errors",
             "--allow-running-insecure-content",
             "--ignore-certificate-errors-spki-list",
             "--ignore-urlfetcher-cert-requests",
-            "--disable-web-security",
         ]
         
         # Performance optimization arguments
         performance_args = [
-            "--disable-extensions",
-            "--disable-plugins", 
-            "--disable-images",
-            "--disable-setuid-sandbox",
-            "--no-first-run",
+            # --disable-images is not a Chrome switch; this skips image loading and decoding
+            "--blink-settings=imagesEnabled=false",
             "--no-default-browser-check",
-            "--disable-default-apps",
-            "--disable-background-timer-throttling",
-            "--disable-renderer-backgrounding",
-            "--disable-features=TranslateUI",
-            "--disable-features=VizDisplayCompositor",
-            "--disable-features=VizServiceDisplayCompositor",
-            "--disable-features=NetworkService",
-            "--use-gl=disabled",
-            "--disable-gl-drawing-for-tests",
             "--no-proxy-server",
-            "--memory-pressure-off",
-            "--max_old_space_size=4096",
+            "--renderer-process-limit=2",
+            "--js-flags=--max-old-space-size=2048",
         ]
         
-        for arg in security_args + performance_args:
+        for arg in PLAYWRIGHT_FLAGS + tuple(security_args + performance_args):
             options.add_argument(arg)
         
         # User agent
@@ -135,15 +189,7 @@ class WebDriverManager:
             ImportError: If webdriver-manager is needed but not installed
         """
         if self.chrome_config.chrome_driver_path is None:
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-                logger.info("Using webdriver-manager to install Chrome driver")
-            except ImportError:
-                raise ImportError(
-                    "webdriver-manager not installed. Please install it "
-                    "(`pip install webdriver-manager`) or specify chrome_driver_path in config."
-                )
+            service = Service(_resolve_chromedriver_path())
         else:
             service = Service(self.chrome_config.chrome_driver_path)
         
@@ -156,9 +202,50 @@ class WebDriverManager:
         if not self._driver:
             return
             
+        # keep_alive=True gives the command executor a urllib3 PoolManager;
+        # anything else means a new TCP connection per WebDriver command
+        connection = getattr(self._driver.command_executor, "_conn", None)
+        if not isinstance(connection, urllib3.PoolManager):
+            logger.warning(
+                "chromedriver connection is %s, not a pooled keep-alive connection",
+                type(connection).__name__
+            )
+        
         window_size = self.chrome_config.window_size
         self._driver.set_window_size(window_size["width"], window_size["height"])
-        self._driver.implicitly_wait(self.chrome_config.implicit_wait)
+        # New sessions start with implicit wait 0, which explicit waits rely on;
+        # only spend the round trip if a non-default value is configured
+        if self.chrome_config.implicit_wait:
+            logger.warning(
+                "implicit_wait=%ss compounds with explicit waits; 0 is recommended",
+                self.chrome_config.implicit_wait
+            )
+            self._driver.implicitly_wait(self.chrome_config.implicit_wait)
+        self._block_unneeded_requests()
+    
+    def _block_unneeded_requests(self) -> None:
+        """Drop image/font/tracker requests before they are fetched.
+        
+        imagesEnabled=false only stops the renderer from loading images; fonts
+        and trackers are still fetched unless blocked via the
+        DevTools protocol, which keeps the bytes off the wire entirely.
+        """
+        patterns = self.chrome_config.blocked_url_patterns
+        if not patterns:
+            return
+        
+        try:
+            self._driver.execute_cdp_cmd("Network.enable", {})
+            self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            # Requests a service worker makes on the page's behalf are not
+            # subject to the page's block list; bypass the worker entirely
+            self._driver.execute_cdp_cmd("Network.setBypassServiceWorker", {"bypass": True})
+            # Keep the HTTP cache across navigations so the search page's
+            # scripts are not re-downloaded for every query
+            self._driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            logger.debug("Blocking %s URL patterns via CDP", len(patterns))
+        except Exception as e:
+            logger.warning("Could not enable CDP request blocking: %s", e)
     
     def __enter__(self):
         """Context manager entry."""
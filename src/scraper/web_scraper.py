@@ -1,22 +1,50 @@
 """Main web scraper orchestration module."""
 
-import time
+import os
 import logging
+from datetime import datetime
 from typing import List, Dict, Any, Optional
+from urllib.parse import quote_plus
+
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from config.config_models import SiteConfig, ScrapingConfig
+from llm import json_codec
 from .element_finder import ElementFinder
 from .page_interaction_handler import PageInteractionHandler
 from .data_extractor import DataExtractor, ScrapingResult
+from .html_extractor import HtmlDataExtractor, LXML_AVAILABLE
 
 
 logger = logging.getLogger(__name__)
 
 
+# Visible text of every element matching a selector union, in one DOM walk
+_VISIBLE_TEXTS_JS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .filter((el) => el.offsetParent !== null)
+    .map((el) => el.innerText);
+"""
+
+# Substrings of a no-results message, checked in lowercase
+_NO_RESULT_TEXTS = (
+    "0 results",
+    "no results",
+    "returned 0 results",
+    "no items found",
+    "no products found",
+)
+
+# Characters replaced with "_" when a search term becomes part of a filename
+_UNSAFE_FILENAME_TABLE = str.maketrans({char: "_" for char in ' /\\:*?"<>|'})
+
+
 class NoResultsChecker:
     """Handles checking for 'no results' conditions."""
     
@@ -39,33 +67,41 @@ class NoResultsChecker:
             True if no results were found, False otherwise
         """
         try:
-            no_results_elements = self.element_finder.find_elements_with_selectors(
-                scraping_config.no_results_selectors
-            )
+            if not scraping_config.no_results_selectors:
+                return False
             
-            for element in no_results_elements:
-                if element.is_displayed():
-                    element_text = element.text.lower()
-                    
-                    # Check for specific no-results indicators
-                    no_results_indicators = [
-                        "0 results",
-                        "no results",
-                        "returned 0 results",
-                        "no items found",
-                        "no products found",
-                        f"results for \"{search_term.lower()}\"" and "0" in element_text
-                    ]
-                    
-                    for indicator in no_results_indicators:
-                        if indicator and indicator in element_text:
-                            logger.info(f"No results detected: {element_text.strip()}")
-                            return True
+            # One round trip and one DOM traversal for the union of all selectors
+            # instead of find/is_displayed/text per selector
+            joined_selector = ", ".join(scraping_config.no_results_selectors)
+            try:
+                element_texts = self.element_finder.driver.execute_script(
+                    _VISIBLE_TEXTS_JS, joined_selector
+                )
+            except WebDriverException:
+                element_texts = [
+                    element.text
+                    for element in self.element_finder.find_elements_with_selectors(joined_selector)
+                    if element.is_displayed()
+                ]
+            
+            search_phrase = f"results for \"{search_term.lower()}\""
+            
+            for element_text in element_texts:
+                if not element_text:
+                    continue
+                element_text = element_text.lower()
+                
+                if (
+                    any(indicator in element_text for indicator in _NO_RESULT_TEXTS)
+                    or (search_phrase in element_text and "0" in element_text)
+                ):
+                    logger.info("No results detected: %s", element_text.strip())
+                    return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error checking for no results: {e}")
+            logger.error("Error checking for no results: %s", e)
             return False
 
 
@@ -88,35 +124,58 @@ class SearchHandler:
         self.driver = driver
         self.element_finder = element_finder
         self.page_handler = page_handler
+        self._search_input: Optional[WebElement] = None
     
-    def perform_search(self, search_term: str, scraping_config: ScrapingConfig) -> bool:
+    def perform_search(
+        self,
+        search_term: str,
+        scraping_config: ScrapingConfig,
+        search_input: Optional[WebElement] = None
+    ) -> bool:
         """Perform search operation on the current page.
         
         Args:
             search_term: Term to search for
             scraping_config: Configuration for search elements
+            search_input: Search input the caller already located; looked up
+                again only if it can no longer be typed into
             
         Returns:
             True if search was performed successfully, False otherwise
         """
         try:
             # Find and fill search input
-            if not self._enter_search_term(search_term, scraping_config):
+            if not self._enter_search_term(search_term, scraping_config, search_input):
                 return False
             
             # Find and click search button or use Enter key
             if not self._trigger_search(scraping_config):
                 return False
             
-            logger.info(f"Search performed successfully for: {search_term}")
+            logger.info("Search performed successfully for: %s", search_term)
             return True
             
         except Exception as e:
-            logger.error(f"Error performing search for '{search_term}': {e}")
+            logger.error("Error performing search for '%s': %s", search_term, e)
             return False
     
-    def _enter_search_term(self, search_term: str, scraping_config: ScrapingConfig) -> bool:
+    def _enter_search_term(
+        self,
+        search_term: str,
+        scraping_config: ScrapingConfig,
+        search_input: Optional[WebElement] = None
+    ) -> bool:
         """Enter search term into search input field."""
+        if search_input is not None:
+            try:
+                search_input.clear()
+                search_input.send_keys(search_term)
+                self._search_input = search_input
+                logger.info("Entered search term: %s", search_term)
+                return True
+            except WebDriverException as e:
+                logger.debug("Known search input unusable, looking it up again: %s", e)
+        
         logger.debug("Looking for search input...")
         
         search_input = self.element_finder.find_element_with_selectors(
@@ -133,10 +192,11 @@ class SearchHandler:
         try:
             search_input.clear()
             search_input.send_keys(search_term)
-            logger.info(f"Entered search term: {search_term}")
+            self._search_input = search_input
+            logger.info("Entered search term: %s", search_term)
             return True
         except Exception as e:
-            logger.error(f"Error entering search term: {e}")
+            logger.error("Error entering search term: %s", e)
             return False
     
     def _trigger_search(self, scraping_config: ScrapingConfig) -> bool:
@@ -158,39 +218,54 @@ class SearchHandler:
                     logger.info("Clicked search button successfully")
                     return True
             except Exception as e:
-                logger.warning(f"Error clicking search button: {e}")
+                logger.warning("Error clicking search button: %s", e)
         
         # Fallback: try Enter key
-        return self._fallback_enter_key()
+        return self._fallback_enter_key(scraping_config)
     
-    def _fallback_enter_key(self) -> bool:
+    def _fallback_enter_key(self, scraping_config: ScrapingConfig) -> bool:
         """Use Enter key as fallback search method."""
+        # The input the term was just typed into is the right target
+        if self._search_input is not None:
+            try:
+                self._search_input.send_keys(Keys.RETURN)
+                logger.info("Used Enter key as search fallback")
+                return True
+            except WebDriverException as e:
+                logger.debug("Search input went stale, looking it up again: %s", e)
+        
         try:
-            # Find search input again and press Enter
-            search_input = self.driver.find_element(By.TAG_NAME, "input")
-            search_input.send_keys(Keys.RETURN)
+            # Find the search input again (any input as a last resort) and press
+            # Enter; find_elements returns [] on a miss instead of raising
+            search_inputs = (
+                self.element_finder.find_elements_with_selectors(scraping_config.search_input_selectors)
+                or self.driver.find_elements(By.TAG_NAME, "input")
+            )
+            if not search_inputs:
+                logger.error("Enter key fallback failed: no input element on page")
+                return False
+            search_inputs[0].send_keys(Keys.RETURN)
             logger.info("Used Enter key as search fallback")
             return True
         except Exception as e:
-            logger.error(f"Enter key fallback failed: {e}")
+            logger.error("Enter key fallback failed: %s", e)
             return False
     
     def _debug_available_inputs(self) -> None:
         """Debug method to show available input elements."""
         try:
             inputs = self.driver.find_elements(By.TAG_NAME, "input")
-            logger.debug(f"Found {len(inputs)} input elements on page")
+            logger.debug("Found %s input elements on page", len(inputs))
             for i, inp in enumerate(inputs[:5]):  # Show first 5
                 input_type = inp.get_attribute('type')
                 placeholder = inp.get_attribute('placeholder')
                 name = inp.get_attribute('name')
                 id_attr = inp.get_attribute('id')
                 logger.debug(
-                    f"Input {i}: type='{input_type}', placeholder='{placeholder}', "
-                    f"name='{name}', id='{id_attr}'"
+                    "Input %s: type='%s', placeholder='%s', name='%s', id='%s'", i, input_type, placeholder, name, id_attr
                 )
         except Exception as e:
-            logger.warning(f"Error debugging inputs: {e}")
+            logger.warning("Error debugging inputs: %s", e)
 
 
 class WebScraper:
@@ -206,8 +281,11 @@ class WebScraper:
         self.element_finder = ElementFinder(driver)
         self.page_handler = PageInteractionHandler(driver, self.element_finder)
         self.data_extractor = DataExtractor(self.element_finder)
+        self.html_extractor = HtmlDataExtractor() if LXML_AVAILABLE else None
         self.search_handler = SearchHandler(driver, self.element_finder, self.page_handler)
         self.no_results_checker = NoResultsChecker(self.element_finder)
+        self._search_page_loaded = False
+        self._page_load_timeout: Optional[int] = None
     
     def scrape_site(
         self,
@@ -229,50 +307,155 @@ class WebScraper:
         scraping_config = site_config.scraping_config
         
         try:
-            # Setup page load timeout
-            self.driver.set_page_load_timeout(scraping_config.page_load_timeout)
+            # Setup page load timeout (one round trip, only when it changes)
+            if self._page_load_timeout != scraping_config.page_load_timeout:
+                self.driver.set_page_load_timeout(scraping_config.page_load_timeout)
+                self._page_load_timeout = scraping_config.page_load_timeout
             
-            # Navigate to the target URL
-            if not self._navigate_to_site(site_config.target_url):
-                return results
+            if scraping_config.search_page_url:
+                # The results page has its own URL: one navigation replaces
+                # loading the home page and filling in the search form
+                search_url = scraping_config.search_page_url.format(
+                    query=quote_plus(search_term), limit=scraping_config.max_results_per_query
+                )
+                if not self._navigate_to_site(search_url):
+                    return results
+            else:
+                # Navigate to the target URL
+                if not self._navigate_to_site(site_config.target_url):
+                    return results
+                
+                # Handle initial page setup
+                self._setup_page(scraping_config)
+                
+                # Perform search
+                if not self.search_handler.perform_search(search_term, scraping_config):
+                    return results
+            self._search_page_loaded = True
             
-            # Handle initial page setup
-            self._setup_page()
+            results = self._collect_search_results(search_term, site_config, debug_mode)
             
-            # Perform search
-            if not self.search_handler.perform_search(search_term, scraping_config):
-                return results
+        except TimeoutException:
+            logger.error("Timeout during search for '%s'", search_term)
+        except Exception as e:
+            logger.error("Unexpected error during scraping for '%s': %s", search_term, e)
+            if debug_mode:
+                import traceback
+                traceback.print_exc()
+        
+        return results
+    
+    def scrape_next(
+        self,
+        search_term: str,
+        site_config: SiteConfig,
+        debug_mode: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Scrape a follow-up search term without reloading the site.
+        
+        After a first scrape_site() the search input usually stays in the page
+        header, so the next query is submitted from the current page after
+        clearing cookies and storage. Falls back to a full scrape_site() when
+        no page is loaded yet, the previous query left no product cards to
+        watch for replacement, or the search input is gone, and always uses it
+        when the site has a search_page_url to navigate to directly.
+        
+        Args:
+            search_term: Term to search for
+            site_config: Site configuration containing all scraping parameters
+            debug_mode: Whether to enable debug mode
             
-            # Wait for results and check for no-results condition
-            if not self._wait_for_search_results(search_term, scraping_config):
-                return results
+        Returns:
+            List of dictionaries containing scraped product data
+        """
+        if not self._search_page_loaded or site_config.scraping_config.search_page_url:
+            return self.scrape_site(search_term, site_config, debug_mode)
+        
+        results = []
+        scraping_config = site_config.scraping_config
+        
+        try:
+            # Remember a current card so we can tell when the new results replace it.
+            # Without one (the previous query had no results) nothing would go
+            # stale, and the old no-results message would be read as this
+            # query's; reload the site instead.
+            previous_cards = self.element_finder.find_elements_with_selectors(
+                scraping_config.product_card_selectors, limit=1
+            )
+            if not previous_cards:
+                logger.info("No previous results to replace, reloading site")
+                return self.scrape_site(search_term, site_config, debug_mode)
             
-            # Take screenshot after search results are loaded
+            self.driver.delete_all_cookies()
+            self.driver.execute_script("sessionStorage.clear(); localStorage.clear();")
             
-            safe_search_term = search_term.replace(" ", "_").replace("/", "_")
-            screenshot_filename = f"search_results_{safe_search_term}"
-            self.page_handler.take_screenshot(
-                screenshot_filename, 
-                f"Search results for '{search_term}'"
+            search_inputs = self.element_finder.find_elements_with_selectors(
+                scraping_config.search_input_selectors
             )
-                
-            # Extract product data
-            results = self._extract_product_data(scraping_config, debug_mode)
-
-            self._dump_results_to_file(results, search_term, site_config.site_name)
+            if not search_inputs:
+                logger.info("Search input not present on current page, reloading site")
+                return self.scrape_site(search_term, site_config, debug_mode)
+            
+            # Reuse the input found above rather than locating it a second time
+            if not self.search_handler.perform_search(search_term, scraping_config, search_inputs[0]):
+                return self.scrape_site(search_term, site_config, debug_mode)
+            
+            try:
+                # Results usually swap in well under the default 0.5s poll
+                WebDriverWait(self.driver, scraping_config.wait_timeout, poll_frequency=0.1).until(
+                    EC.staleness_of(previous_cards[0])
+                )
+            except TimeoutException:
+                logger.warning("Previous results still present after search, continuing")
             
-            logger.info(f"Successfully extracted {len(results)} products for '{search_term}'")
+            results = self._collect_search_results(search_term, site_config, debug_mode)
             
         except TimeoutException:
-            logger.error(f"Timeout during search for '{search_term}'")
+            logger.error("Timeout during search for '%s'", search_term)
         except Exception as e:
-            logger.error(f"Unexpected error during scraping for '{search_term}': {e}")
-            if debug_mode:
-                import traceback
-                traceback.print_exc()
+            logger.error("Unexpected error during scraping for '%s': %s", search_term, e)
         
         return results
     
+    def _collect_search_results(
+        self,
+        search_term: str,
+        site_config: SiteConfig,
+        debug_mode: bool
+    ) -> List[Dict[str, Any]]:
+        """Wait for submitted search results, then extract and dump them.
+        
+        Args:
+            search_term: The search term used
+            site_config: Site configuration
+            debug_mode: Whether debug mode is enabled
+            
+        Returns:
+            List of extracted product data dictionaries
+        """
+        scraping_config = site_config.scraping_config
+        
+        # Wait for results and check for no-results condition
+        if not self._wait_for_search_results(search_term, scraping_config):
+            return []
+        
+        # A full-window PNG capture costs more than the whole batch extraction,
+        # so screenshots of the results page are a debug-mode aid only
+        if debug_mode:
+            safe_search_term = search_term.translate(_UNSAFE_FILENAME_TABLE)
+            self.page_handler.take_screenshot(
+                f"search_results_{safe_search_term}",
+                f"Search results for '{search_term}'"
+            )
+            
+        # Extract product data
+        results = self._extract_product_data(scraping_config, debug_mode)
+
+        self._dump_results_to_file(results, search_term, site_config.site_name)
+        
+        logger.info("Successfully extracted %s products for '%s'", len(results), search_term)
+        return results
+    
     def _navigate_to_site(self, target_url: str) -> bool:
         """Navigate to the target URL.
         
@@ -283,26 +466,32 @@ class WebScraper:
             True if navigation was successful, False otherwise
         """
         try:
-            logger.info(f"Navigating to {target_url}")
+            logger.info("Navigating to %s", target_url)
             self.driver.get(target_url)
-            logger.info(f"Successfully navigated to {target_url}")
-            logger.debug(f"Page title: {self.driver.title}")
+            logger.info("Successfully navigated to %s", target_url)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Page title: %s", self.driver.title)
             return True
         except Exception as e:
-            logger.error(f"Error loading page: {e}")
+            logger.error("Error loading page: %s", e)
             return False
     
-    def _setup_page(self) -> None:
-        """Setup page after navigation."""
-        # Wait for page to load completely
-        self.page_handler.wait_for_page_load(10)
+    def _setup_page(self, scraping_config: ScrapingConfig) -> None:
+        """Setup page after navigation.
+        
+        Args:
+            scraping_config: Scraping configuration
+        """
+        # With an eager page load strategy the search input is the real
+        # readiness signal, not document.readyState == "complete"
+        self.element_finder.find_element_with_selectors(
+            scraping_config.search_input_selectors,
+            timeout=scraping_config.wait_timeout
+        )
         
         # Handle modal popups that might interfere
         logger.info("Checking for modal popups...")
         self.page_handler.handle_modal_popups()
-        
-        # Additional wait for dynamic content
-        time.sleep(3)
     
     def _wait_for_search_results(self, search_term: str, scraping_config: ScrapingConfig) -> bool:
         """Wait for search results to load and check for no-results condition.
@@ -316,35 +505,33 @@ class WebScraper:
         """
         logger.info("Waiting for search results...")
         
-        # Wait for search to process
-        time.sleep(3)
+        # Returns as soon as either product cards or a no-results message appear
+        appeared = self.element_finder.wait_for_any(
+            scraping_config.product_card_selectors + scraping_config.no_results_selectors,
+            timeout=scraping_config.wait_timeout
+        )
+        if not appeared:
+            logger.warning("Neither product cards nor a no-results message appeared")
         
         # Handle any new modals
         self.page_handler.handle_modal_popups()
         
-        # Wait for page to finish loading
-        self.page_handler.wait_for_page_load(10)
-        
         # Check for no results first
         if self.no_results_checker.check_no_results(search_term, scraping_config):
-            logger.info(f"Search for '{search_term}' returned no results")
+            logger.info("Search for '%s' returned no results", search_term)
             return False
         
-        # Look for product cards
-        product_card = self.element_finder.find_element_with_selectors(
-            scraping_config.product_card_selectors,
-            timeout=10
-        )
-        
-        if not product_card:
+        # The wait also returns on a present no-results container (some are
+        # always in the DOM, e.g. an empty div.message-alert), so confirm a card
+        # rendered; if the wait matched early, keep waiting for cards alone
+        card_selectors = scraping_config.product_card_selectors
+        if not self.element_finder.find_elements_with_selectors(card_selectors, limit=1) and not (
+            appeared and self.element_finder.wait_for_any(
+                card_selectors, timeout=scraping_config.wait_timeout
+            )
+        ):
             logger.error("Could not find product cards with any selector")
-            logger.debug(f"Current URL: {self.driver.current_url}")
-            
-            # Double-check for no results message after waiting
-            if self.no_results_checker.check_no_results(search_term, scraping_config):
-                logger.info(f"Confirmed: Search for '{search_term}' returned no results")
-                return False
-            
+            logger.debug("Current URL: %s", self.driver.current_url)
             return False
         
         logger.info("Search results page loaded")
@@ -366,48 +553,91 @@ class WebScraper:
         """
         results = []
         
+        # Card structure dumps are DEBUG records, so the per-element path is
+        # only worth its round trips when they will actually be emitted;
+        # development runs at INFO still take the fast paths.
+        inspect_cards = debug_mode and logger.isEnabledFor(logging.DEBUG)
+        
+        # Fast path: extract every card in one script execution
+        if not inspect_cards:
+            batch_results = self.data_extractor.extract_all_products(scraping_config)
+            if batch_results is not None:
+                logger.info("Extracted %s product cards in one pass", len(batch_results))
+                for i, result in enumerate(batch_results):
+                    self._collect_result(result, i+1, debug_mode, results)
+                return results
+        
+        # Second tier: parse the page source in-process (one round trip)
+        if self.html_extractor and not inspect_cards:
+            try:
+                page_results = self.html_extractor.extract_from_page(
+                    self.driver.page_source, scraping_config, self.driver.current_url
+                )
+            except Exception as e:
+                logger.warning("Page source parsing failed, using per-element extraction: %s", e)
+                page_results = []
+            if page_results:
+                logger.info("Parsed %s product cards from page source", len(page_results))
+                for i, result in enumerate(page_results):
+                    self._collect_result(result, i+1, debug_mode, results)
+                return results
+        
         # Find all product cards
-        logger.debug(f"Looking for product cards with selectors: {scraping_config.product_card_selectors}")
+        logger.debug("Looking for product cards with selectors: %s", scraping_config.product_card_selectors)
         
         product_cards = self.element_finder.find_elements_with_selectors(
-            scraping_config.product_card_selectors
+            scraping_config.product_card_selectors,
+            limit=scraping_config.max_results_per_query
         )
         
         if not product_cards:
             logger.warning("No product cards found")
             return results
         
-        logger.info(f"Found {len(product_cards)} product cards")
-        
         # Extract data from each card
-        max_results = min(len(product_cards), scraping_config.max_results_per_query)
-        logger.info(f"Processing {max_results} product cards...")
+        max_results = len(product_cards)
+        logger.info("Processing %s product cards...", max_results)
         
-        for i, card in enumerate(product_cards[:max_results]):
-            logger.debug(f"Scraping product {i+1} of {max_results}")
-            
-            try:
-                result = self.data_extractor.extract_product_data(
-                    card, scraping_config, i+1, debug_mode
-                )
+        # Single-selector configs skip the per-field fallback loops
+        fast_extract = None
+        if not inspect_cards:
+            fast_extract = self.data_extractor.compile_fast_extractor(scraping_config)
+        
+        with self.element_finder.without_implicit_wait():
+            for i, card in enumerate(product_cards[:max_results]):
+                logger.debug("Scraping product %s of %s", i+1, max_results)
                 
-                if result.is_valid():
-                    results.append(result.to_dict())
-                    title_preview = (
-                        result.title[:50] + '...' if len(result.title) > 50 else result.title
-                    )
-                    logger.info(f"-- Scraped Product {i+1}: {title_preview}")
-                else:
-                    logger.debug(f"-- Skipped Product {i+1}: No meaningful data found")
-                    if debug_mode:
-                        logger.debug(f"   Data: {result.to_dict()}")
-                        
-            except Exception as e:
-                logger.error(f"Error extracting data from product {i+1}: {e}")
-                continue
+                try:
+                    if fast_extract:
+                        result = fast_extract(card)
+                    else:
+                        result = self.data_extractor.extract_product_data(
+                            card, scraping_config, i+1, debug_mode
+                        )
+                    self._collect_result(result, i+1, debug_mode, results)
+                            
+                except Exception as e:
+                    logger.error("Error extracting data from product %s: %s", i+1, e)
+                    continue
         
         return results
     
+    def _collect_result(
+        self,
+        result: ScrapingResult,
+        product_number: int,
+        debug_mode: bool,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """Append a result to the output list if it has meaningful data."""
+        if result.is_valid():
+            results.append(result.to_dict())
+            logger.debug("-- Scraped Product %s: %.50s", product_number, result.title)
+        else:
+            logger.debug("-- Skipped Product %s: No meaningful data found", product_number)
+            if debug_mode:
+                logger.debug("   Data: %s", result.to_dict())
+    
     def _dump_results_to_file(self, results: List[Dict[str, Any]], search_term: str, site_name: str) -> None:
         """
         Dump scraping results to a timestamped file.
@@ -417,10 +647,6 @@ class WebScraper:
             search_term: The search term used
             site_name: Name of the site being scraped
         """
-        import os
-        import json
-        from datetime import datetime
-        
         try:
             # Create debug directory if it doesn't exist
             debug_dir = "analysis_result"
@@ -431,7 +657,7 @@ class WebScraper:
             
             # Create safe site name and search term
             safe_site_name = site_name.lower().replace(' ', '').replace('-', '')
-            safe_search_term = search_term.replace(" ", "_").replace("/", "_").replace("\\", "_").replace(":", "_").replace("*", "_").replace("?", "_").replace('"', "_").replace("<", "_").replace(">", "_").replace("|", "_")
+            safe_search_term = search_term.translate(_UNSAFE_FILENAME_TABLE)
             
             # Create filename
             filename = f"{safe_site_name}_scrape_results-{safe_search_term}-{now}.json"
@@ -447,10 +673,9 @@ class WebScraper:
             }
             
             # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results_data, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(results_data, filepath)
             
-            logger.info(f"[DEBUG] Scraping results dumped to: {filepath}")
+            logger.info("[DEBUG] Scraping results dumped to: %s", filepath)
             
         except Exception as e:
-            logger.warning(f"Failed to dump results to file: {e}")
\ No newline at end of file
+            logger.warning("Failed to dump results to file: %s", e)
\ No newline at end of file
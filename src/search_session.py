@@ -1,17 +1,18 @@
 """Search session management and execution module."""
 
-import json
 import logging
 from typing import Dict, List, Any, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from config.config_models import AppConfig
 from scraper.web_scraper import WebScraper
+from scraper.search_api_client import SearchApiClient
+from llm import json_codec
 from llm.evaluation_engine import evaluate_search_results_with_inventory
 from llm.search_classifier import SearchClassifierFactory
 
 # Import the scraper setup function - this might need to be adjusted based on actual module structure
-from scraper.scraper_facade import setup_driver_with_config
+from scraper.scraper_facade import ScraperFacade, setup_driver_with_config
 
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,9 @@ class SearchSession:
         self.scraped_results_file = scraped_results_file
         self.driver: Optional[WebDriver] = None
         self.web_scraper: Optional[WebScraper] = None
-        self._pre_scraped_data: Optional[List[Dict[str, Any]]] = None
+        self._pre_scraped_data: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self.search_api: Optional[SearchApiClient] = None
+        self._prefetched: Dict[str, List[Dict[str, Any]]] = {}
 
          # Initialize search classifier
         self.search_classifier = SearchClassifierFactory.create_classifier("regex")
@@ -41,7 +44,52 @@ class SearchSession:
         if scraped_results_file:
             self._load_pre_scraped_data()
         else:
-            self._initialize_web_driver()
+            search_api = SearchApiClient(
+                config.site_config.scraping_config, config.chrome_config.user_agent
+            )
+            if search_api.enabled:
+                # The browser is only started if the HTTP search fails
+                self.search_api = search_api
+            else:
+                search_api.close()
+                # With parallel prefetching the workers own the browsers;
+                # a local one is only started lazily if a query is missed
+                if config.deployment_config.parallelism <= 1:
+                    self._initialize_web_driver()
+    
+    def prefetch_results(self, queries: List[str]) -> bool:
+        """Scrape all queries up front across parallel workers.
+        
+        Only applies to live scraping with deployment parallelism above 1.
+        With an HTTP search client the requests run concurrently on its
+        session; otherwise each worker process drives its own browser.
+        Evaluation then runs per task against the prefetched results.
+        
+        Args:
+            queries: Search queries in task order
+            
+        Returns:
+            True if the results were prefetched, False if nothing was done
+        """
+        parallelism = self.config.deployment_config.parallelism
+        if self._pre_scraped_data is not None or parallelism <= 1 or len(queries) <= 1:
+            return False
+        
+        logger.info("Prefetching %s queries with parallelism %s", len(queries), parallelism)
+        if self.search_api:
+            # None entries are left for the browser fallback in _scrape_live_results
+            self._prefetched = self.search_api.search_many(queries, parallelism)
+            return True
+        
+        facade = ScraperFacade(self.config.chrome_config)
+        self._prefetched = facade.scrape_with_config_parallel(
+            queries,
+            self.config.site_config,
+            parallelism,
+            self.config.deployment_config.environment == "development",
+            self.config.deployment_config.delay_between_searches
+        )
+        return True
     
     def execute_search(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a complete search task including scraping and evaluation.
@@ -56,7 +104,7 @@ class SearchSession:
         if not query:
             raise ValueError("Search task must contain a 'query' field")
         
-        logger.info(f"Executing search for: '{query}'")
+        logger.info("Executing search for: '%s'", query)
         
         try:
             # Step 1: Get search results (scrape or load from file)
@@ -65,7 +113,7 @@ class SearchSession:
             if not scraped_results:
                 return self._create_failed_result(query, "No search results found", task)
             
-            logger.info(f"Retrieved {len(scraped_results)} search results")
+            logger.info("Retrieved %s search results", len(scraped_results))
             self._log_scraped_results(scraped_results)
             
             # Step 2: Evaluate results with LLM
@@ -75,27 +123,53 @@ class SearchSession:
             return self._create_success_result(query, scraped_results, evaluation_result, task)
             
         except Exception as e:
-            logger.error(f"Error executing search for '{query}': {e}")
+            logger.error("Error executing search for '%s': %s", query, e)
             return self._create_failed_result(query, str(e), task)
     
     def cleanup(self) -> None:
         """Clean up resources used by the search session."""
+        if self.search_api:
+            self.search_api.close()
+            self.search_api = None
+        
         if self.driver:
             try:
                 self.driver.quit()
                 logger.info("WebDriver closed successfully")
             except Exception as e:
-                logger.warning(f"Error closing WebDriver: {e}")
+                logger.warning("Error closing WebDriver: %s", e)
             finally:
                 self.driver = None
                 self.web_scraper = None
     
     def _load_pre_scraped_data(self) -> None:
-        """Load pre-scraped data from file for testing."""
+        """Load pre-scraped data from file for testing.
+        
+        Accepts either a JSON list of {"query", "results"} entries or the NDJSON
+        written by ScraperFacade.stream_results_to_file (one {term: results}
+        object per line). Both are indexed by query so each task's lookup is
+        a dict access; the NDJSON file is read line by line. If a query
+        appears more than once, its first entry wins.
+        """
         try:
-            with open(self.scraped_results_file, "r", encoding="utf-8") as f:
-                self._pre_scraped_data = json.load(f)
-            logger.info(f"Loaded pre-scraped data from {self.scraped_results_file}")
+            if self.scraped_results_file.endswith((".ndjson", ".jsonl")):
+                with open(self.scraped_results_file, "rb") as f:
+                    pairs = [
+                        pair
+                        for line in f if line.strip()
+                        for pair in json_codec.loads(line).items()
+                    ]
+            else:
+                with open(self.scraped_results_file, "rb") as f:
+                    pairs = [
+                        (entry.get("query"), entry.get("results", []))
+                        for entry in json_codec.loads(f.read())
+                    ]
+            
+            self._pre_scraped_data = {}
+            for query, results in pairs:
+                self._pre_scraped_data.setdefault(query, results)
+            logger.info("Loaded pre-scraped data from %s", self.scraped_results_file)
         except Exception as e:
             raise RuntimeError(f"Failed to load pre-scraped data: {e}")
     
@@ -135,13 +209,12 @@ class SearchSession:
         Returns:
             List of scraped results for the query
         """
-        for entry in self._pre_scraped_data:
-            if entry.get("query") == query:
-                results = entry.get("results", [])
-                logger.info(f"Found {len(results)} pre-scraped results for query '{query}'")
-                return results
+        if query in self._pre_scraped_data:
+            results = self._pre_scraped_data[query]
+            logger.info("Found %s pre-scraped results for query '%s'", len(results), query)
+            return results
         
-        logger.warning(f"No pre-scraped results found for query '{query}'")
+        logger.warning("No pre-scraped results found for query '%s'", query)
         return []
     
     def _scrape_live_results(self, query: str) -> List[Dict[str, Any]]:
@@ -153,18 +226,28 @@ class SearchSession:
         Returns:
             List of scraped results
         """
+        if query in self._prefetched or self.search_api:
+            if query in self._prefetched:
+                fetched_results = self._prefetched[query]
+            else:
+                fetched_results = self.search_api.search(query)
+            if fetched_results is not None:
+                return fetched_results
+            logger.info("Falling back to browser scraping for '%s'", query)
+        
         if not self.web_scraper:
-            raise RuntimeError("Web scraper not initialized")
+            self._initialize_web_driver()
         
         debug_mode = self.config.deployment_config.environment == "development"
         
-        scraped_results = self.web_scraper.scrape_site(
+        # Later queries re-submit the search from the current page
+        scraped_results = self.web_scraper.scrape_next(
             search_term=query,
             site_config=self.config.site_config,
             debug_mode=debug_mode
         )
         
-        logger.info(f"Scraped {len(scraped_results)} results for query '{query}'")
+        logger.info("Scraped %s results for query '%s'", len(scraped_results), query)
         return scraped_results
     
     def _evaluate_search_results(
@@ -201,11 +284,11 @@ class SearchSession:
         )
         
         status = evaluation_result.get('status', 'unknown')
-        logger.info(f"LLM evaluation completed with status: {status}")
+        logger.info("LLM evaluation completed with status: %s", status)
         
         if status == 'success':
             evaluations = evaluation_result.get('evaluations', [])
-            logger.info(f"Successfully evaluated {len(evaluations)} results")
+            logger.info("Successfully evaluated %s results", len(evaluations))
             self._log_evaluation_results(evaluations, scraped_results)
         
         return evaluation_result
@@ -216,13 +299,16 @@ class SearchSession:
         Args:
             scraped_results: Results to log
         """
-        logger.info("Scraped results summary:")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("Scraped results summary:")
         for i, result in enumerate(scraped_results):
             title = result.get('title', 'N/A')
             title_short = title[:40] + '...' if len(title) > 40 else title
             quantity = result.get('quantity', 'N/A')
             part_number = result.get('part_number', 'N/A')
-            logger.info(f"  {i+1}: {title_short} | Qty: {quantity} | Part: {part_number}")
+            logger.debug("  %s: %s | Qty: %s | Part: %s", i+1, title_short, quantity, part_number)
     
     def _log_evaluation_results(
         self,
@@ -244,7 +330,7 @@ class SearchSession:
                 title_short = title[:40] + '...' if len(title) > 40 else title
                 relevance = eval_item.get('relevance', 'N/A')
                 quantity = result.get('quantity', 'N/A')
-                logger.info(f"  {rank}: {title_short} | Relevance: {relevance} | Qty: {quantity}")
+                logger.info("  %s: %s | Relevance: %s | Qty: %s", rank, title_short, relevance, quantity)
     
     def _create_success_result(
         self,
@@ -335,7 +421,7 @@ class SearchSessionManager:
             try:
                 session.cleanup()
             except Exception as e:
-                logger.warning(f"Error cleaning up session: {e}")
+                logger.warning("Error cleaning up session: %s", e)
         
         self.active_sessions.clear()
         logger.info("All search sessions cleaned up")
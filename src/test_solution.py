@@ -13,43 +13,54 @@ from main import run_agentic_search
 class TestSearchTypeClassification(unittest.TestCase):
     """Test the search type classification logic"""
     
-    def test_english_word_classification(self):
-        """Test that single English words are classified correctly"""
-        self.assertEqual(classify_search_type("gasket"), "english_word")
-        self.assertEqual(classify_search_type("alternator"), "english_word")
-        self.assertEqual(classify_search_type("refrigerator"), "english_word")
+    CASES = [
+        # Single English words
+        ("gasket", "english_word"),
+        ("alternator", "english_word"),
+        ("refrigerator", "english_word"),
+        # Part numbers
+        ("BK608", "part_number"),
+        ("513188", "part_number"),
+        ("HB88548", "part_number"),
+        ("12-345", "part_number"),
+        # Multiple term queries
+        ("brake pads toyota camry", "multiple_terms"),
+        ("fuel pump assembly", "multiple_terms"),
+        ("commercial refrigerator parts", "multiple_terms"),
+    ]
     
-    def test_part_number_classification(self):
-        """Test that part numbers are classified correctly"""
-        self.assertEqual(classify_search_type("BK608"), "part_number")
-        self.assertEqual(classify_search_type("513188"), "part_number")
-        self.assertEqual(classify_search_type("HB88548"), "part_number")
-        self.assertEqual(classify_search_type("12-345"), "part_number")
-    
-    def test_multiple_terms_classification(self):
-        """Test that multiple term queries are classified correctly"""
-        self.assertEqual(classify_search_type("brake pads toyota camry"), "multiple_terms")
-        self.assertEqual(classify_search_type("fuel pump assembly"), "multiple_terms")
-        self.assertEqual(classify_search_type("commercial refrigerator parts"), "multiple_terms")
+    def test_classification(self):
+        """Test that every query type is classified correctly"""
+        for term, expected in self.CASES:
+            with self.subTest(term=term):
+                self.assertEqual(classify_search_type(term), expected)
 
 class TestScraperFunctionality(unittest.TestCase):
     """Test the web scraping functionality"""
     
+    @staticmethod
+    def _mock_chrome_driver(mock_chrome):
+        """Return a MagicMock driver wired up as the patched Chrome's instance"""
+        mock_driver = MagicMock(name="Driver")
+        mock_chrome.return_value = mock_driver
+        return mock_driver
+    
     @patch("scraper.webdriver.Chrome")
     def test_scraper_setup(self, mock_chrome):
         """Test that the WebDriver setup works correctly"""
-        mock_driver = MagicMock()
-        mock_chrome.return_value = mock_driver
+        self._mock_chrome_driver(mock_chrome)
         
         driver = setup_driver()
         self.assertIsNotNone(driver)
     
+    # Waits against the mock driver resolve on the first poll; patching sleep
+    # removes the remaining real pauses between steps
+    @patch("time.sleep", return_value=None)
     @patch("scraper.webdriver.Chrome")
-    def test_scraper_search(self, mock_chrome):
+    def test_scraper_search(self, mock_chrome, mock_sleep):
         """Test that the scraper can perform a search and extract results"""
         # Mock the WebDriver and its methods
-        mock_driver = MagicMock()
-        mock_chrome.return_value = mock_driver
+        mock_driver = self._mock_chrome_driver(mock_chrome)
         
         # Mock finding elements
         mock_product_card = MagicMock(name="ProductCard")
@@ -0,0 +1,160 @@
+"""
+Tests for the pooled WebDriver lifecycle: acquire, release and recycling.
+
+WebDriverManager is replaced by a stub so no browser is started.
+"""
+
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from config.config_models import ChromeConfig
+from scraper.browser_pool import BrowserPool
+from scraper.exceptions import WebDriverError
+
+
+class StubDriverManager:
+    """Stands in for WebDriverManager; fails once ``fail_after`` drivers exist."""
+
+    created = []
+    fail_after = None
+
+    def __init__(self, chrome_config):
+        self.chrome_config = chrome_config
+
+    def create_driver(self):
+        if self.fail_after is not None and len(self.created) >= self.fail_after:
+            return None
+        driver = MagicMock(name=f"Driver{len(self.created)}")
+        StubDriverManager.created.append(driver)
+        return driver
+
+
+@pytest.fixture
+def chrome_config():
+    """Minimal Chrome configuration for a two-driver pool."""
+    return ChromeConfig(
+        chrome_driver_path=None,
+        headless=True,
+        window_size={"width": 1280, "height": 800},
+        implicit_wait=0,
+        user_agent="test-agent",
+        pool_size=2,
+        max_uses_per_instance=2
+    )
+
+
+@pytest.fixture(autouse=True)
+def stub_manager():
+    """Patch the pool's WebDriverManager and reset the stub between tests."""
+    StubDriverManager.created = []
+    StubDriverManager.fail_after = None
+    with patch("scraper.browser_pool.WebDriverManager", StubDriverManager):
+        yield StubDriverManager
+
+
+class TestBrowserPool:
+    """Test acquire/release/recycle behavior."""
+
+    def test_prewarms_configured_size(self, chrome_config, stub_manager):
+        """Test that the pool starts pool_size drivers up front."""
+        pool = BrowserPool(chrome_config)
+
+        assert len(stub_manager.created) == 2
+        assert pool.live == 2
+
+    def test_lease_returns_driver_to_pool(self, chrome_config):
+        """Test that a leased driver is reset and handed out again."""
+        pool = BrowserPool(chrome_config, size=1, max_uses=10)
+
+        with pool.lease() as driver:
+            first = driver
+
+        assert pool.acquire(timeout=0) is first
+        first.delete_all_cookies.assert_called_once()
+
+    def test_recycles_after_max_uses(self, chrome_config, stub_manager):
+        """Test that a worn-out driver is quit and replaced."""
+        pool = BrowserPool(chrome_config, size=1, max_uses=1)
+
+        driver = pool.acquire()
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire(timeout=0) is stub_manager.created[1]
+        assert pool.live == 1
+
+    def test_recycles_unhealthy_driver(self, chrome_config, stub_manager):
+        """Test that a driver failing the health check is replaced."""
+        pool = BrowserPool(chrome_config, size=1, max_uses=10)
+
+        driver = pool.acquire()
+        driver.get.side_effect = Exception("session deleted")
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire(timeout=0) is stub_manager.created[1]
+
+    def test_failed_replacement_shrinks_pool(self, chrome_config, stub_manager):
+        """Test that a failed replacement shrinks the pool and acquire fails fast."""
+        pool = BrowserPool(chrome_config, size=1, max_uses=1)
+        stub_manager.fail_after = 1
+
+        pool.release(pool.acquire())
+
+        assert pool.live == 0
+        with pytest.raises(WebDriverError):
+            pool.acquire()
+
+    def test_waiter_fails_when_last_driver_is_lost(self, chrome_config, stub_manager):
+        """Test that a blocked acquire wakes up once no drivers are left."""
+        pool = BrowserPool(chrome_config, size=1, max_uses=1)
+        stub_manager.fail_after = 1
+        driver = pool.acquire()
+        errors = []
+
+        def waiter():
+            try:
+                pool.acquire()
+            except WebDriverError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        pool.release(driver)
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+    def test_acquire_timeout(self, chrome_config):
+        """Test that acquire gives up after the timeout when all drivers are leased."""
+        pool = BrowserPool(chrome_config, size=1)
+        pool.acquire()
+
+        with pytest.raises(WebDriverError):
+            pool.acquire(timeout=0.05)
+
+    def test_close_quits_idle_and_released_drivers(self, chrome_config, stub_manager):
+        """Test that close quits idle drivers now and leased ones on release."""
+        pool = BrowserPool(chrome_config)
+        leased = pool.acquire()
+
+        pool.close()
+
+        idle = stub_manager.created[1]
+        idle.quit.assert_called_once()
+        leased.quit.assert_not_called()
+        pool.release(leased)
+        leased.quit.assert_called_once()
+        with pytest.raises(WebDriverError):
+            pool.acquire()
+
+    def test_constructor_failure_quits_started_drivers(self, chrome_config, stub_manager):
+        """Test that drivers started before a failed pre-warm are not leaked."""
+        stub_manager.fail_after = 1
+
+        with pytest.raises(WebDriverError):
+            BrowserPool(chrome_config)
+
+        stub_manager.created[0].quit.assert_called_once()